@@ -44,7 +44,7 @@ from pdm.models.python import PythonInfo
 from pdm.models.requirements import Requirement, parse_requirement, strip_extras
 from pdm.models.specifiers import get_specifier
 from pdm.project import Project
-from pdm.resolver import resolve
+from pdm.resolver import resolve, resolve_from_lock_graph
 from pdm.utils import normalize_name
 
 PEP582_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "pep582")
@@ -120,6 +120,8 @@ def do_lock(
             data = format_lockfile(project, mapping, dependencies)
             ui.echo(f"{termui.Emoji.LOCK} Lock successful")
             hooks.try_emit("post_lock", resolution=mapping, dry_run=dry_run)
+        finally:
+            provider.repository.commit_caches()
 
     project.write_lockfile(data, write=not dry_run)
 
@@ -138,15 +140,21 @@ def resolve_candidates_from_lockfile(
     ]
     with ui.logging("install-resolve"):
         with ui.open_spinner("Resolving packages from lockfile..."):
-            reporter = BaseReporter()
             provider = project.get_provider(for_install=True)
-            resolver: Resolver = project.core.resolver_class(provider, reporter)
-            mapping, *_ = resolve(
-                resolver,
-                reqs,
-                project.environment.python_requires,
-                resolve_max_rounds,
-            )
+            # The lock file is already a resolution, follow its edges directly
+            # and only resolve again if it is stale or ambiguous.
+            mapping = resolve_from_lock_graph(provider, reqs)
+            if mapping is None:
+                provider = project.get_provider(for_install=True)
+                resolver: Resolver = project.core.resolver_class(
+                    provider, BaseReporter()
+                )
+                mapping, *_ = resolve(
+                    resolver,
+                    reqs,
+                    project.environment.python_requires,
+                    resolve_max_rounds,
+                )
             fetch_hashes(provider.repository, mapping)
     return mapping
 
@@ -175,6 +183,52 @@ def check_lockfile(project: Project, raise_not_exist: bool = True) -> str | None
     return None
 
 
+# Settings that change the result of an installation
+SYNC_FINGERPRINT_CONFIG = ("install.cache", "install.cache_method", "install.compile")
+# At most this many projects have their fingerprints kept in the cache
+MAX_SYNC_FINGERPRINTS = 100
+
+
+def get_sync_fingerprint(
+    project: Project, groups: Collection[str], **flags: object
+) -> str:
+    """Get a fingerprint of the inputs and the target of a sync, which changes
+    when the lock file, the selected groups, options or install settings, or the
+    installed packages change. The last one is detected by the modification time of the
+    site-packages directories, which is updated when a distribution is added or
+    removed.
+    """
+    paths = project.environment.get_paths()
+    data = {
+        "lockfile": hashlib.sha256(project.lockfile_file.read_bytes()).hexdigest(),
+        "pyproject": hashlib.sha256(project.pyproject_file.read_bytes()).hexdigest(),
+        "python": str(project.python.executable),
+        "groups": sorted(groups),
+        "flags": {
+            k: sorted(v) if isinstance(v, Collection) else v for k, v in flags.items()
+        },
+        "config": {key: project.config[key] for key in SYNC_FINGERPRINT_CONFIG},
+        "paths": {
+            path: os.stat(path).st_mtime_ns if os.path.exists(path) else None
+            for path in sorted({paths["purelib"], paths["platlib"]})
+        },
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def save_sync_fingerprint(
+    fingerprints: JSONFileCache[str, str], project_key: str, fingerprint: str
+) -> None:
+    """Save the fingerprint as the most recent one, dropping those of the projects
+    that don't exist anymore and the oldest ones beyond the limit.
+    """
+    kept = [key for key in fingerprints if key != project_key and os.path.exists(key)]
+    items = {key: fingerprints.get(key) for key in kept[-MAX_SYNC_FINGERPRINTS + 1 :]}
+    items[project_key] = fingerprint
+    fingerprints.clear()
+    fingerprints.update(items)
+
+
 def do_sync(
     project: Project,
     *,
@@ -193,11 +247,44 @@ def do_sync(
 ) -> None:
     """Synchronize project"""
     hooks = hooks or HookManager(project)
+    fingerprint: str | None = None
     if requirements is None:
         groups = translate_groups(project, default, dev, groups or ())
         requirements = []
         for group in groups:
             requirements.extend(project.get_dependencies(group).values())
+        if (
+            not dry_run
+            and not reinstall
+            and not tracked_names
+            and project.lockfile_file.exists()
+        ):
+            # Skip the synchronization if nothing has changed since the last
+            # successful sync. The lock file is only resolved for the hooks.
+            sync_flags = dict(
+                clean=clean,
+                no_editable=no_editable,
+                no_self=no_self,
+                only_keep=only_keep,
+            )
+            fingerprint = get_sync_fingerprint(project, groups, **sync_flags)
+            project.cache_dir.mkdir(parents=True, exist_ok=True)
+            fingerprints: JSONFileCache[str, str] = JSONFileCache(
+                project.cache_dir / "sync_fingerprints.json"
+            )
+            project_key = str(project.root)
+            if (
+                project_key in fingerprints
+                and fingerprints.get(project_key) == fingerprint
+            ):
+                if hooks.should_run("pre_install") or hooks.should_run("post_install"):
+                    candidates = resolve_candidates_from_lockfile(project, requirements)
+                else:
+                    candidates = {}
+                hooks.try_emit("pre_install", candidates=candidates, dry_run=False)
+                project.core.ui.echo("All packages are synced to date, nothing to do.")
+                hooks.try_emit("post_install", candidates=candidates, dry_run=False)
+                return
     candidates = resolve_candidates_from_lockfile(project, requirements)
     if tracked_names and dry_run:
         candidates = {
@@ -217,6 +304,13 @@ def do_sync(
     hooks.try_emit("pre_install", candidates=candidates, dry_run=dry_run)
     handler.synchronize()
     hooks.try_emit("post_install", candidates=candidates, dry_run=dry_run)
+    if fingerprint is not None:
+        # The installation has changed the site-packages directories
+        save_sync_fingerprint(
+            fingerprints,
+            project_key,
+            get_sync_fingerprint(project, groups, **sync_flags),
+        )
 
 
 def do_add(
@@ -7,7 +7,9 @@ from pdm import termui
 from pdm.cli.commands.base import BaseCommand
 from pdm.cli.options import verbose_option
 from pdm.exceptions import PdmUsageError
+from pdm.models.caches import SafeFileCache, WheelCache
 from pdm.project import Project
+from pdm.project.config import parse_size
 
 
 class Command(BaseCommand):
@@ -21,6 +23,7 @@ class Command(BaseCommand):
         RemoveCommand.register_to(subparsers, "remove")
         ListCommand.register_to(subparsers, "list")
         InfoCommand.register_to(subparsers, "info")
+        GCCommand.register_to(subparsers, "gc")
         parser.set_defaults(search_parent=False)
         self.parser = parser
 
@@ -55,12 +58,18 @@ def format_size(size: float) -> str:
         return f"{int(size)} bytes"
 
 
+def find_wheels(parent: Path, pattern: str) -> Iterable[Path]:
+    for file in find_files(parent, pattern):
+        if file.name != WheelCache.MANIFEST_NAME:
+            yield file
+
+
 def remove_cache_files(project: Project, pattern: str) -> None:
     if not pattern:
         raise PdmUsageError("Please provide a pattern")
 
     wheel_cache = project.cache("wheels")
-    files = list(find_files(wheel_cache, pattern))
+    files = list(find_wheels(wheel_cache, pattern))
 
     if not files:
         raise PdmUsageError("No matching files found")
@@ -167,7 +176,7 @@ class ListCommand(BaseCommand):
     def handle(self, project: Project, options: argparse.Namespace) -> None:
         rows = [
             (format_size(file_size(file)), file.name)
-            for file in find_files(project.cache("wheels"), options.pattern)
+            for file in find_wheels(project.cache("wheels"), options.pattern)
         ]
         project.core.ui.display_columns(rows, [">Size", "Filename"])
 
@@ -197,3 +206,34 @@ class InfoCommand(BaseCommand):
                 output.append(f"    Files: {len(files)}, Size: {format_size(size)}")
 
         project.core.ui.echo("\n".join(output))
+
+
+class GCCommand(BaseCommand):
+    """Evict the least recently used HTTP cache entries to fit the size budget"""
+
+    arguments = [verbose_option]
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--max-size",
+            type=parse_size,
+            help="The size budget like 500MB, default to the value of "
+            "`cache.http.max_size` config",
+        )
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        max_size = options.max_size
+        if max_size is None:
+            max_size = project.config["cache.http.max_size"]
+        if not max_size:
+            raise PdmUsageError(
+                "No size budget is given, pass --max-size or set the "
+                "[green]`cache.http.max_size`[/] config"
+            )
+        cache = SafeFileCache(str(project.cache("http")))
+        with project.core.ui.open_spinner("Collecting HTTP caches..."):
+            removed, freed = cache.gc(max_size)
+        project.core.ui.echo(
+            f"{removed} file{'s' if removed != 1 else ''} removed, "
+            f"{format_size(freed)} freed"
+        )
@@ -389,7 +389,7 @@ function TabExpansion($line, $lastWord) {
             default {
                 # No command
                 $command = $null
-                $completer.AddOpts(([Option]::new(("--pep582", "-I", "--ignore-python", "-c", "--config"))))
+                $completer.AddOpts(([Option]::new(("--pep582", "-I", "--ignore-python", "--offline", "-c", "--config"))))
                 $completer.AddParams($AllCommands, $false)
             }
         }
@@ -351,6 +351,13 @@ ignore_python_option = Option(
     help="Ignore the Python path saved in the .pdm.toml config",
 )
 
+offline_option = Option(
+    "--offline",
+    action="store_true",
+    help="Run without network access, only read from the local caches "
+    "[env var: PDM_OFFLINE]",
+)
+
 prerelease_option = Option(
     "--pre",
     "--prerelease",
@@ -668,6 +668,7 @@ def fetch_hashes(repository: BaseRepository, mapping: Mapping[str, Candidate]) -
 
     with ThreadPoolExecutor() as executor:
         executor.map(do_fetch, mapping.values())
+    repository.commit_caches()
 
 
 def is_pipx_installation() -> bool:
@@ -22,7 +22,12 @@ from pdm import termui
 from pdm.__version__ import __version__
 from pdm.cli.actions import check_update, print_pep582_command
 from pdm.cli.commands.base import BaseCommand
-from pdm.cli.options import ignore_python_option, pep582_option, verbose_option
+from pdm.cli.options import (
+    ignore_python_option,
+    offline_option,
+    pep582_option,
+    verbose_option,
+)
 from pdm.cli.utils import ErrorArgumentParser, PdmFormatter
 from pdm.compat import importlib_metadata
 from pdm.exceptions import PdmArgumentError, PdmUsageError
@@ -79,6 +84,7 @@ class Core:
         self.parser._positionals.title = "Commands"
         verbose_option.add_to_parser(self.parser)
         ignore_python_option.add_to_parser(self.parser)
+        offline_option.add_to_parser(self.parser)
         pep582_option.add_to_parser(self.parser)
 
         self.subparsers = self.parser.add_subparsers(
@@ -162,6 +168,8 @@ class Core:
         self.ui.set_verbosity(options.verbose)
         if options.ignore_python:
             os.environ["PDM_IGNORE_SAVED_PYTHON"] = "1"
+        if options.offline:
+            os.environ["PDM_OFFLINE"] = "1"
 
         if options.pep582:
             print_pep582_command(self.ui, options.pep582)
@@ -197,7 +205,10 @@ class Core:
                     )
                 sys.exit(1)
             else:
-                if options.project.config["check_update"]:
+                if (
+                    options.project.config["check_update"]
+                    and not options.project.config["offline"]
+                ):
                     check_update(options.project)
 
     def register_command(
@@ -30,6 +30,10 @@ class InvalidPyVersion(PdmUsageError, ValueError):
     pass
 
 
+class OfflineError(PdmUsageError):
+    pass
+
+
 class CandidateNotFound(PdmException):
     pass
 
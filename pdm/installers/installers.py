@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import base64
+import csv
+import hashlib
 import io
 import itertools
 import json
 import os
+import subprocess
 import zipfile
 from functools import lru_cache
 from pathlib import Path
@@ -16,6 +20,7 @@ from installer.records import RecordEntry
 from installer.sources import WheelFile as _WheelFile
 
 from pdm.installers.packages import CachedPackage
+from pdm.models.in_process import compile_files
 from pdm.termui import logger
 from pdm.utils import cached_property, fs_supports_symlink
 
@@ -170,8 +175,11 @@ class InstallDestination(SchemeDictionaryDestination):
 
 def install_wheel(
     wheel: str, environment: Environment, direct_url: dict[str, Any] | None = None
-) -> None:
-    """Install a normal wheel file into the environment."""
+) -> str:
+    """Install a normal wheel file into the environment.
+
+    Return the .dist-info path
+    """
     additional_metadata = None
     if direct_url is not None:
         additional_metadata = {
@@ -182,16 +190,18 @@ def install_wheel(
         interpreter=str(environment.interpreter.executable),
         script_kind=_get_kind(environment),
     )
-    _install_wheel(
+    return _install_wheel(
         wheel=wheel, destination=destination, additional_metadata=additional_metadata
     )
 
 
 def install_wheel_with_cache(
     wheel: str, environment: Environment, direct_url: dict[str, Any] | None = None
-) -> None:
+) -> str:
     """Only create .pth files referring to the cached package.
     If the cache doesn't exist, create one.
+
+    Return the .dist-info path
     """
     wheel_stem = Path(wheel).stem
     cache_path = environment.project.cache("packages") / wheel_stem
@@ -257,6 +267,7 @@ def install_wheel_with_cache(
         additional_metadata=additional_metadata,
     )
     package_cache.add_referrer(dist_info_dir)
+    return dist_info_dir
 
 
 def _install_wheel(
@@ -280,6 +291,44 @@ def _install_wheel(
     return os.path.join(destination.scheme_dict[root_scheme], source.dist_info_dir)
 
 
+def compile_dists(dist_info_dirs: Iterable[str], environment: Environment) -> None:
+    """Byte-compile the Python files recorded in the RECORD of the distributions
+    with the interpreter of the environment, and add the compiled files to the
+    RECORD so that they are removed along with the distributions.
+    """
+    sources: dict[str, tuple[str, str]] = {}
+    for dist_info in dist_info_dirs:
+        root = os.path.dirname(dist_info)
+        with open(os.path.join(dist_info, "RECORD"), newline="") as f:
+            for row in csv.reader(f):
+                # Only the files in the library directory are importable
+                if row and row[0].endswith(".py") and not row[0].startswith(".."):
+                    sources[os.path.join(root, row[0])] = (dist_info, root)
+    if not sources:
+        return
+    try:
+        compiled = compile_files(str(environment.interpreter.executable), [*sources])
+    except subprocess.CalledProcessError as e:
+        logger.warning("Failed to compile the installed files: %s", e)
+        return
+    new_records: dict[str, list[list[str]]] = {}
+    for source, cache_file in compiled.items():
+        dist_info, root = sources[source]
+        with open(cache_file, "rb") as f:
+            content = f.read()
+        digest = base64.urlsafe_b64encode(hashlib.sha256(content).digest())
+        new_records.setdefault(dist_info, []).append(
+            [
+                Path(os.path.relpath(cache_file, root)).as_posix(),
+                f"sha256={digest.rstrip(b'=').decode()}",
+                str(len(content)),
+            ]
+        )
+    for dist_info, rows in new_records.items():
+        with open(os.path.join(dist_info, "RECORD"), "a", newline="") as f:
+            csv.writer(f, lineterminator="\n").writerows(rows)
+
+
 def _get_kind(environment: Environment) -> str:
     if os.name != "nt":
         return "posix"
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 from pdm import termui
 from pdm.exceptions import UninstallError
-from pdm.installers.installers import install_wheel, install_wheel_with_cache
+from pdm.installers.installers import (
+    compile_dists,
+    install_wheel,
+    install_wheel_with_cache,
+)
 from pdm.installers.uninstallers import BaseRemovePaths, StashedRemovePaths
 
 if TYPE_CHECKING:
@@ -24,6 +28,16 @@ class InstallManager:
     ) -> None:
         self.environment = environment
         self.use_install_cache = use_install_cache
+        # The .dist-info paths of the distributions installed but not compiled yet
+        self._uncompiled: list[str] = []
+
+    def download(self, candidate: Candidate) -> None:
+        """Download and unpack the candidate, before it is built and installed"""
+        candidate.prepare(self.environment).obtain()
+
+    def build(self, candidate: Candidate) -> None:
+        """Build the candidate into a wheel if it isn't one, before it is installed"""
+        candidate.prepare(self.environment).build()
 
     def install(self, candidate: Candidate) -> None:
         if (
@@ -32,11 +46,25 @@ class InstallManager:
             and candidate.name not in self.NO_CACHE_PACKAGES
         ):
             # Only cache wheels from PyPI
-            installer = install_wheel_with_cache
+            installer: Callable[
+                [str, Environment, dict[str, Any] | None], str
+            ] = install_wheel_with_cache
         else:
             installer = install_wheel
         prepared = candidate.prepare(self.environment)
-        installer(str(prepared.build()), self.environment, prepared.direct_url())
+        dist_info = installer(
+            str(prepared.build()), self.environment, prepared.direct_url()
+        )
+        # The cached packages are shared by projects, leave them uncompiled
+        if installer is install_wheel:
+            self._uncompiled.append(dist_info)
+
+    def compile(self) -> None:
+        """Byte-compile the Python files of the distributions installed since the
+        last compilation.
+        """
+        dist_info_dirs, self._uncompiled = self._uncompiled, []
+        compile_dists(dist_info_dirs, self.environment)
 
     def get_paths_to_remove(self, dist: Distribution) -> BaseRemovePaths:
         """Get the path collection to be removed from the disk"""
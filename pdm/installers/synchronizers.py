@@ -1,23 +1,28 @@
 from __future__ import annotations
 
 import functools
-import multiprocessing
+import os
+import threading
+import time
 import traceback
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, Any, Callable, Collection, TypeVar
 
+from cachecontrol.controller import CacheController
 from rich.progress import SpinnerColumn
 
 from pdm import termui
 from pdm.exceptions import InstallationError
 from pdm.installers.manager import InstallManager
+from pdm.models.caches import JSONFileCache, SafeFileCache
 from pdm.models.candidates import Candidate
 from pdm.models.environment import Environment
 from pdm.models.requirements import parse_requirement, strip_extras
-from pdm.utils import is_editable
+from pdm.utils import cached_property, is_editable
 
 if TYPE_CHECKING:
     from rich.progress import Progress
+    from unearth import Link
 
     from pdm.compat import Distribution
 
@@ -68,6 +73,88 @@ class DummyExecutor:
         return
 
 
+class AdaptiveLimiter:
+    """Limit the number of jobs running at the same time, and adjust the limit by
+    the observed throughput.
+
+    After every window of completed jobs in which some jobs had to wait for a slot,
+    the limit moves a step in the same direction if the throughput has improved,
+    or turns back if it has dropped.
+
+    :param max_limit: the upper bound of the limit
+    :param initial_limit: the limit to start with
+    """
+
+    def __init__(self, max_limit: int, initial_limit: int = 2) -> None:
+        self.max_limit = max(max_limit, 1)
+        self.limit = min(initial_limit, self.max_limit)
+        self._running = 0
+        self._condition = threading.Condition()
+        self._direction = 1
+        self._completed = 0
+        self._queued = 0
+        self._window_start = time.perf_counter()
+        self._last_throughput = 0.0
+
+    def run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Call the function when the number of running jobs is under the limit"""
+        with self._condition:
+            if self._running >= self.limit:
+                self._queued += 1
+            while self._running >= self.limit:
+                self._condition.wait()
+            self._running += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._condition:
+                self._running -= 1
+                self._completed += 1
+                if self._completed >= max(self.limit, 2):
+                    self._adjust()
+                self._condition.notify_all()
+
+    def _adjust(self) -> None:
+        now = time.perf_counter()
+        throughput = self._completed / max(now - self._window_start, 1e-6)
+        # If no job has waited, the throughput is bound by the jobs submitted
+        # rather than the limit, so keep the limit as it is.
+        if self._queued:
+            if throughput < self._last_throughput:
+                self._direction = -self._direction
+            self.limit = min(max(self.limit + self._direction, 1), self.max_limit)
+            termui.logger.debug(
+                "Throughput %.2f jobs/s, adjust the limit to %d", throughput, self.limit
+            )
+        self._last_throughput = throughput
+        self._completed = self._queued = 0
+        self._window_start = now
+
+
+class StageExecutor:
+    """The thread pool of a stage of installation, whose jobs are run under the
+    limiter if given.
+    """
+
+    def __init__(self, max_workers: int, limiter: AdaptiveLimiter | None = None):
+        self.max_workers = max_workers
+        self.limiter = limiter
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> Future[_T]:
+        if self.limiter is None:
+            return self._executor.submit(fn, *args, **kwargs)
+        limiter = self.limiter
+
+        def run() -> _T:
+            return limiter.run(fn, *args, **kwargs)
+
+        return self._executor.submit(run)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
 def editables_candidate(environment: Environment) -> Candidate | None:
     """Return a candidate for `editables` package"""
     repository = environment.project.get_repository()
@@ -91,6 +178,8 @@ class Synchronizer:
     """
 
     SEQUENTIAL_PACKAGES = ("pip", "setuptools", "wheel")
+    #: A rough speed to estimate the seconds of installing an artifact by its size
+    INSTALL_BYTES_PER_SECOND = 20 * 1024 * 1024
 
     def __init__(
         self,
@@ -142,14 +231,30 @@ class Synchronizer:
                 candidates[key].req.editable = False
         self.candidates = candidates
         self._manager: InstallManager | None = None
-
-    def create_executor(
-        self,
-    ) -> ThreadPoolExecutor | DummyExecutor:
-        if self.parallel:
-            return ThreadPoolExecutor(max_workers=min(multiprocessing.cpu_count(), 8))
-        else:
-            return DummyExecutor()
+        #: The seconds spent in each stage of the parallel jobs, keyed by the job key
+        self.job_timings: dict[str, dict[str, float]] = {}
+
+    def create_executor(self) -> DummyExecutor:
+        """Create the executor of sequential installation, parallel installation
+        uses the executors of :meth:`create_stage_executors` instead.
+        """
+        return DummyExecutor()
+
+    def create_stage_executors(self) -> dict[str, StageExecutor]:
+        """Create the executors of the download, build and install stages of
+        parallel installation.
+        """
+        config = self.environment.project.config
+        max_workers = config["install.max_workers"]
+        executors: dict[str, StageExecutor] = {}
+        for stage in ("download", "build", "install"):
+            workers = config[f"install.{stage}_workers"]
+            if not workers:
+                # Builds are CPU and memory heavy, keep their pool smaller
+                workers = max(max_workers // 2, 1) if stage == "build" else max_workers
+            limiter = AdaptiveLimiter(workers) if config["install.adaptive"] else None
+            executors[stage] = StageExecutor(workers, limiter)
+        return executors
 
     @property
     def manager(self) -> InstallManager:
@@ -262,6 +367,141 @@ class Synchronizer:
 
         return dist, can
 
+    def _timed(self, key: str, stage: str, func: Callable[..., _T], *args: Any) -> _T:
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.job_timings.setdefault(key, {})[stage] = time.perf_counter() - start
+
+    def _run_stage(
+        self,
+        key: str,
+        stage: str,
+        description: str,
+        func: Callable[[], Any],
+        progress: Progress,
+    ) -> None:
+        job = progress.add_task(description, total=1)
+        try:
+            self._timed(key, stage, func)
+        finally:
+            progress.update(job, completed=1, visible=False)
+
+    @cached_property
+    def _http_cache(self) -> SafeFileCache:
+        return SafeFileCache(str(self.environment.project.cache("http")))
+
+    def _get_artifact_size(self, can: Candidate, link: Link) -> int:
+        """Get the size of the artifact of the link if it is a local file, or
+        is found in the HTTP cache or the wheel cache, otherwise return 0.
+        """
+        if link.is_file:
+            return os.path.getsize(link.file_path) if link.file_path.is_file() else 0
+        size = self._http_cache.get_size(CacheController.cache_url(link.normalized))
+        if size is not None:
+            return size
+        wheel = self.environment.project.make_wheel_cache().get(
+            link, can.name, self.environment.target_python
+        )
+        return wheel.stat().st_size if wheel is not None else 0
+
+    def estimate_cost(self, key: str, last_timings: JSONFileCache[str, float]) -> float:
+        """Estimate the seconds a job takes, by the duration of the last job of the
+        same package, or the size of the artifact if it is available locally.
+        """
+        if key in last_timings:
+            return last_timings.get(key)
+        can = self.candidates.get(key)
+        if can is None:
+            return 0.0
+        # The link to install isn't chosen before the candidate is prepared,
+        # so take the largest of the locked files.
+        links = [can.link] if can.link is not None else list(can.hashes or ())
+        size = max((self._get_artifact_size(can, link) for link in links), default=0)
+        return size / self.INSTALL_BYTES_PER_SECOND
+
+    def _report_timings(self) -> dict[str, float]:
+        """Log the timings of jobs from the slowest, and return the total seconds
+        of each job.
+        """
+        totals = {key: sum(stages.values()) for key, stages in self.job_timings.items()}
+        for key in sorted(totals, key=totals.__getitem__, reverse=True):
+            termui.logger.info(
+                "%s took %.2fs (%s)",
+                key,
+                totals[key],
+                ", ".join(
+                    f"{stage}: {seconds:.2f}s"
+                    for stage, seconds in self.job_timings[key].items()
+                ),
+            )
+        return totals
+
+    def submit_staged(
+        self,
+        executors: dict[str, StageExecutor],
+        handler: Callable[[str, Progress], Any],
+        key: str,
+        progress: Progress,
+    ) -> Future:
+        """Submit a job of adding or updating a candidate. The candidate is
+        downloaded and built in the download and build stages, before the handler
+        is called in the install stage. So a slow build doesn't hold back the
+        downloads and installations of other packages.
+
+        :returns: a future of the result of the handler
+        """
+        result: Future = Future()
+        can = self.candidates[key]
+
+        def chain(future: Future, then: Callable[[Any], None]) -> None:
+            def callback(done: Future) -> None:
+                try:
+                    then(done.result())
+                except BaseException as e:
+                    result.set_exception(e)
+
+            future.add_done_callback(callback)
+
+        def install(_: Any) -> None:
+            chain(
+                executors["install"].submit(
+                    self._timed, key, "install", handler, key, progress
+                ),
+                result.set_result,
+            )
+
+        def build(_: Any) -> None:
+            if can.prepare(self.environment).wheel:
+                # Wheels don't wait in the queue of builds
+                install(None)
+                return
+            chain(
+                executors["build"].submit(
+                    self._run_stage,
+                    key,
+                    "build",
+                    f"Building {can.format()}...",
+                    functools.partial(self.manager.build, can),
+                    progress,
+                ),
+                install,
+            )
+
+        chain(
+            executors["download"].submit(
+                self._run_stage,
+                key,
+                "download",
+                f"Downloading {can.format()}...",
+                functools.partial(self.manager.download, can),
+                progress,
+            ),
+            build,
+        )
+        return result
+
     def remove_distribution(self, key: str, progress: Progress) -> Distribution:
         """Remove distributions with given names."""
         dist = self.working_set[key]
@@ -359,6 +599,14 @@ class Synchronizer:
                 else:
                     parallel_jobs.append((kind, key))
 
+        # Start the longest jobs first so that they don't become the tail
+        timings_cache: JSONFileCache[str, float] = JSONFileCache(
+            self.environment.project.cache("metadata") / "install_timings.json"
+        )
+        parallel_jobs.sort(
+            key=lambda job: self.estimate_cost(job[1], timings_cache), reverse=True
+        )
+
         errors: list[str] = []
         failed_jobs: list[tuple[str, str]] = []
 
@@ -383,18 +631,58 @@ class Synchronizer:
             for kind, key in sequential_jobs:
                 handlers[kind](key, progress)
             for i in range(self.retry_times + 1):
-                with self.create_executor() as executor:
-                    for kind, key in parallel_jobs:
-                        future = executor.submit(handlers[kind], key, progress)
-                        future.add_done_callback(
-                            functools.partial(update_progress, kind=kind, key=key)
-                        )
+                if self.parallel:
+                    executors = self.create_stage_executors()
+                    futures: list[Future] = []
+                    try:
+                        for kind, key in parallel_jobs:
+                            if kind == "remove":
+                                future = executors["install"].submit(
+                                    self._timed,
+                                    key,
+                                    kind,
+                                    handlers[kind],
+                                    key,
+                                    progress,
+                                )
+                            else:
+                                future = self.submit_staged(
+                                    executors, handlers[kind], key, progress
+                                )
+                            future.add_done_callback(
+                                functools.partial(update_progress, kind=kind, key=key)
+                            )
+                            futures.append(future)
+                        # The stages submit jobs to each other, wait for all jobs
+                        # to complete before shutting down the executors.
+                        wait(futures)
+                    finally:
+                        for stage_executor in executors.values():
+                            stage_executor.shutdown()
+                else:
+                    with self.create_executor() as executor:
+                        for kind, key in parallel_jobs:
+                            job = executor.submit(
+                                self._timed, key, kind, handlers[kind], key, progress
+                            )
+                            job.add_done_callback(
+                                functools.partial(update_progress, kind=kind, key=key)
+                            )
                 if not failed_jobs or i == self.retry_times:
                     break
                 parallel_jobs, failed_jobs = failed_jobs, []
                 errors.clear()
                 live.console.print("Retry failed jobs")
 
+            totals = self._report_timings()
+            timings_cache.update(
+                {
+                    key: totals[key]
+                    for key, stages in self.job_timings.items()
+                    if "remove" not in stages
+                }
+            )
+
             if errors:
                 if self.ui.verbosity < termui.Verbosity.DETAIL:
                     live.console.print("\n[red]ERRORS[/]:")
@@ -415,4 +703,8 @@ class Synchronizer:
                 else:
                     self.install_candidate(self_key, progress)
 
+            if self.environment.project.config["install.compile"]:
+                live.console.print("Compiling the installed packages...")
+                self.manager.compile()
+
             live.console.print(f"\n{termui.Emoji.POPPER} All complete!")
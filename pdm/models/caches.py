@@ -4,23 +4,43 @@ import contextlib
 import dataclasses
 import hashlib
 import json
+import marshal
 import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Generic, Iterable, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+    cast,
+)
+from urllib.parse import urlparse
 
 import requests
 from cachecontrol.cache import BaseCache
 from cachecontrol.caches import FileCache
 from packaging.utils import canonicalize_name, parse_wheel_filename
+from unearth import Link
 
 from pdm._types import CandidateInfo
+from pdm.compat import tomllib
 from pdm.exceptions import PdmException
 from pdm.models.candidates import Candidate
 from pdm.termui import logger
-from pdm.utils import atomic_open_for_write
+from pdm.utils import atomic_open_for_write, normalize_name
 
 if TYPE_CHECKING:
-    from unearth import Link, TargetPython
+    from unearth import TargetPython
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
@@ -51,6 +71,9 @@ class JSONFileCache(Generic[KT, VT]):
     def __contains__(self, obj: KT) -> bool:
         return self._get_key(obj) in self._cache
 
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._cache))
+
     @classmethod
     def _get_key(cls, obj: KT) -> str:
         return str(obj)
@@ -64,6 +87,12 @@ class JSONFileCache(Generic[KT, VT]):
         self._cache[key] = value
         self._write_cache()
 
+    def update(self, items: Mapping[KT, VT]) -> None:
+        """Set many items and write the cache only once."""
+        for obj, value in items.items():
+            self._cache[self._get_key(obj)] = value
+        self._write_cache()
+
     def delete(self, obj: KT) -> None:
         try:
             del self._cache[self._get_key(obj)]
@@ -76,9 +105,156 @@ class JSONFileCache(Generic[KT, VT]):
         self._write_cache()
 
 
-class CandidateInfoCache(JSONFileCache[Candidate, CandidateInfo]):
+class SQLiteFileCache(Generic[KT, VT]):
+    """A file cache that stores key-value pairs in a SQLite database.
+
+    Values are JSON-serialized and read lazily per key. New entries are kept in
+    memory until :meth:`commit` is called, so that they can be written to the disk
+    in one transaction.
+    """
+
+    TABLE_NAME = "cache"
+    MAX_VARIABLES = 500
+
+    def __init__(self, cache_file: Path) -> None:
+        self.cache_file = cache_file
+        self._pending: dict[str, VT] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                str(self.cache_file), timeout=10, check_same_thread=False
+            )
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _read_value(self, key: str) -> VT:
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            row = None
+            with contextlib.suppress(sqlite3.Error):
+                row = (
+                    self._get_connection()
+                    .execute(
+                        f"SELECT value FROM {self.TABLE_NAME} WHERE key = ?", (key,)
+                    )
+                    .fetchone()
+                )
+        if row is None:
+            raise KeyError(key)
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, obj: KT) -> bool:
+        try:
+            self._read_value(self._get_key(obj))
+        except KeyError:
+            return False
+        return True
+
+    @classmethod
+    def _get_key(cls, obj: KT) -> str:
+        return str(obj)
+
+    def get(self, obj: KT) -> VT:
+        return self._read_value(self._get_key(obj))
+
+    def get_many(self, objs: Iterable[KT]) -> dict[KT, VT]:
+        """Look up multiple objects at once, missing ones are omitted in the result."""
+        keys: dict[str, KT] = {}
+        for obj in objs:
+            with contextlib.suppress(KeyError):
+                keys[self._get_key(obj)] = obj
+        result: dict[KT, VT] = {}
+        with self._lock:
+            missing = []
+            for key, obj in keys.items():
+                if key in self._pending:
+                    result[obj] = self._pending[key]
+                else:
+                    missing.append(key)
+            rows: list[tuple[str, str]] = []
+            with contextlib.suppress(sqlite3.Error):
+                conn = self._get_connection()
+                # Split into chunks to stay below the limit of SQL variables
+                for i in range(0, len(missing), self.MAX_VARIABLES):
+                    chunk = missing[i : i + self.MAX_VARIABLES]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(
+                        conn.execute(
+                            f"SELECT key, value FROM {self.TABLE_NAME} "
+                            f"WHERE key IN ({placeholders})",
+                            chunk,
+                        ).fetchall()
+                    )
+        for key, value in rows:
+            with contextlib.suppress(json.JSONDecodeError):
+                result[keys[key]] = json.loads(value)
+        return result
+
+    def set(self, obj: KT, value: VT) -> None:
+        key = self._get_key(obj)
+        with self._lock:
+            self._pending[key] = value
+
+    def delete(self, obj: KT) -> None:
+        key = self._get_key(obj)
+        with self._lock:
+            if key in self._pending:
+                del self._pending[key]
+            with contextlib.suppress(sqlite3.Error):
+                conn = self._get_connection()
+                with conn:
+                    conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            with contextlib.suppress(sqlite3.Error):
+                conn = self._get_connection()
+                with conn:
+                    conn.execute(f"DELETE FROM {self.TABLE_NAME}")
+
+    def commit(self) -> None:
+        """Write all pending entries to the database."""
+        with self._lock:
+            if not self._pending:
+                return
+            items = [(k, json.dumps(v)) for k, v in self._pending.items()]
+            with contextlib.suppress(sqlite3.Error):
+                conn = self._get_connection()
+                with conn:
+                    conn.executemany(
+                        f"INSERT OR REPLACE INTO {self.TABLE_NAME} (key, value) "
+                        "VALUES (?, ?)",
+                        items,
+                    )
+                self._pending.clear()
+
+    def close(self) -> None:
+        """Commit the pending entries and close the database connection."""
+        with self._lock:
+            self.commit()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CandidateInfoCache(SQLiteFileCache[Candidate, CandidateInfo]):
     """A cache manager that stores the
     candidate -> (dependencies, requires_python, summary) mapping.
+
+    The metadata doesn't depend on the Python range of the project, so one store
+    is shared by all projects on the machine.
     """
 
     @classmethod
@@ -90,7 +266,31 @@ class CandidateInfoCache(JSONFileCache[Candidate, CandidateInfo]):
         extras = (
             "[{}]".format(",".join(sorted(obj.req.extras))) if obj.req.extras else ""
         )
-        return f"{obj.name}{extras}-{obj.version}"
+        key = f"{normalize_name(obj.name)}{extras}-{obj.version}"
+        if obj.link is None:
+            return key
+        if obj.req.is_named:
+            # Releases of the same name and version on different indexes may
+            # not be the same, so they are identified by the index page.
+            source = obj.link.comes_from or obj.link.url_without_fragment
+            key += f"@{Link(source).redacted}"
+        else:
+            # File and VCS requirements are identified by where they come from.
+            key += f"@{obj.link.redacted}"
+        return key
+
+
+class IndexPageCache(SQLiteFileCache[Link, dict]):
+    """A cache of the links parsed from index pages, so that unchanged pages
+    don't need to be parsed again.
+
+    Each entry is keyed by the page URL and records the validator(ETag or
+    Last-Modified) of the response it was parsed from.
+    """
+
+    @classmethod
+    def _get_key(cls, obj: Link) -> str:
+        return obj.redacted
 
 
 class HashCache:
@@ -107,6 +307,9 @@ class HashCache:
 
     def __init__(self, directory: Path) -> None:
         self.directory = directory
+        self._store: SQLiteFileCache[str, str] = SQLiteFileCache(
+            directory / "hashes.db"
+        )
 
     def _read_from_link(self, link: Link, session: requests.Session) -> Iterable[bytes]:
         if link.is_file:
@@ -138,23 +341,88 @@ class HashCache:
             self.set(link.url_without_fragment, hash_value)
         return hash_value
 
-    def _get_path_for_key(self, key: str) -> Path:
-        hashed = hashlib.sha224(key.encode("utf-8")).hexdigest()
-        parts = (hashed[:2], hashed[2:4], hashed[4:6], hashed[6:8], hashed[8:])
-        return self.directory.joinpath(*parts)
+    @staticmethod
+    def _get_key(url: str) -> str:
+        # The URLs may contain credentials, don't store them on the disk.
+        return hashlib.sha224(url.encode("utf-8")).hexdigest()
 
     def get(self, url: str) -> str | None:
-        path = self._get_path_for_key(url)
-        with contextlib.suppress(OSError, UnicodeError):
-            return path.read_text("utf-8").strip()
-        return None
+        try:
+            return self._store.get(self._get_key(url))
+        except KeyError:
+            return None
+
+    def get_many(self, urls: Iterable[str]) -> dict[str, str]:
+        """Get the cached hashes of the given URLs in one query."""
+        keys = {self._get_key(url): url for url in urls}
+        return {keys[key]: value for key, value in self._store.get_many(keys).items()}
 
     def set(self, url: str, hash: str) -> None:
-        path = self._get_path_for_key(url)
-        with contextlib.suppress(OSError, UnicodeError):
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with atomic_open_for_write(path, encoding="utf-8") as fp:
-                fp.write(hash)
+        self._store.set(self._get_key(url), hash)
+
+    def commit(self) -> None:
+        """Write the newly added hashes to the disk."""
+        self._store.commit()
+
+
+class LockfileCache:
+    """Caches the parsed content of lock files in the :mod:`marshal` format, which
+    loads much faster than parsing the TOML again.
+
+    The entries are keyed by the hash of the lock file content, so a changed lock
+    file is never read from a stale entry. Only the most recently used
+    ``MAX_ENTRIES`` entries are kept.
+    """
+
+    MAX_ENTRIES = 20
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _get_cache_path(self, content: bytes) -> Path:
+        # The marshal format may change between Python versions
+        digest = hashlib.sha256(content).hexdigest()
+        return self.directory / f"{digest}.{sys.implementation.cache_tag}.marshal"
+
+    def load(self, path: Path) -> dict[str, Any]:
+        """Load the content of the lock file at the given path."""
+        content = path.read_bytes()
+        cache_path = self._get_cache_path(content)
+        with contextlib.suppress(OSError, EOFError, ValueError, TypeError):
+            data = marshal.loads(cache_path.read_bytes())
+            with contextlib.suppress(OSError):
+                # Record the access time for eviction
+                os.utime(cache_path)
+            return data
+        data = tomllib.loads(content.decode("utf-8"))
+        with contextlib.suppress(OSError, ValueError):
+            with atomic_open_for_write(cache_path, mode="wb") as f:
+                marshal.dump(data, f)
+            self._evict()
+        return data
+
+    def _evict(self) -> None:
+        entries = sorted(
+            self.directory.glob("*.marshal"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for entry in entries[self.MAX_ENTRIES :]:
+            with contextlib.suppress(OSError):
+                entry.unlink()
+
+
+_tags_priorities: dict[str, dict[str, int]] = {}
+
+
+def _get_tags_priorities(target_python: TargetPython) -> dict[str, int]:
+    """Get the priorities of supported tags, memoized per target python."""
+    key = json.dumps(dataclasses.astuple(target_python))
+    if key not in _tags_priorities:
+        _tags_priorities[key] = {
+            str(tag): i for i, tag in enumerate(target_python.supported_tags())
+        }
+    return _tags_priorities[key]
 
 
 class WheelCache:
@@ -163,20 +431,43 @@ class WheelCache:
     Wheels are only cached when the URL contains egg-info or is a VCS repository
     with an *immutable* revision. There might be more than one wheels built for
     one sdist, the one with most preferred tag will be returned.
+
+    Each cache directory keeps a manifest of the names and tags of the wheels in it,
+    so that lookups don't need to list the directory and parse the filenames. The
+    directory is scanned again when the manifest has no matching wheel.
     """
 
+    MANIFEST_NAME = "manifest.json"
+
     def __init__(self, directory: Path) -> None:
         self.directory = directory
 
-    def _get_candidates(
-        self, link: Link, target_python: TargetPython
-    ) -> Iterable[Path]:
-        path = self.get_path_for_link(link, target_python)
-        if not path.exists():
-            return
+    def _build_manifest(self, path: Path) -> list[tuple[str, str, list[str]]]:
+        entries: list[tuple[str, str, list[str]]] = []
         for candidate in path.iterdir():
-            if candidate.name.endswith(".whl"):
-                yield candidate
+            if not candidate.name.endswith(".whl"):
+                continue
+            try:
+                name, *_, tags = parse_wheel_filename(candidate.name)
+            except ValueError:
+                logger.debug("Ignoring invalid cached wheel %s", candidate.name)
+                continue
+            entries.append((candidate.name, name, sorted(map(str, tags))))
+        with contextlib.suppress(OSError):
+            with atomic_open_for_write(path / self.MANIFEST_NAME) as fp:
+                json.dump(entries, fp)
+        return entries
+
+    def _read_manifest(self, path: Path) -> list[tuple[str, str, list[str]]]:
+        try:
+            with open(path / self.MANIFEST_NAME, encoding="utf-8") as fp:
+                return [tuple(entry) for entry in json.load(fp)]  # type: ignore
+        except (OSError, ValueError, TypeError):
+            return self._build_manifest(path)
+
+    def add_wheel(self, wheel: Path) -> None:
+        """Record a wheel that is stored in the cache directory."""
+        self._build_manifest(wheel.parent)
 
     def get_path_for_link(self, link: Link, target_python: TargetPython) -> Path:
         hash_key = {
@@ -198,51 +489,111 @@ class WheelCache:
         parts = (hashed[:2], hashed[2:4], hashed[4:6], hashed[6:])
         return self.directory.joinpath(*parts)
 
-    def get(
-        self, link: Link, project_name: str | None, target_python: TargetPython
-    ) -> Path | None:
-        if not project_name:
-            return None
-        canonical_name = canonicalize_name(project_name)
-        tags_priorities = {
-            tag: i for i, tag in enumerate(target_python.supported_tags())
-        }
-        candidates: list[tuple[int, Path]] = []
-        for candidate in self._get_candidates(link, target_python):
-            try:
-                name, *_, tags = parse_wheel_filename(candidate.name)
-            except ValueError:
-                logger.debug("Ignoring invalid cached wheel %s", candidate.name)
-                continue
+    def _find_best(
+        self,
+        entries: list[tuple[str, str, list[str]]],
+        canonical_name: str,
+        tags_priorities: dict[str, int],
+    ) -> str | None:
+        candidates: list[tuple[int, str]] = []
+        for filename, name, tags in entries:
             if canonical_name != canonicalize_name(name):
                 logger.debug(
                     "Ignoring cached wheel %s with invalid project name %s, "
                     "expected: %s",
-                    candidate.name,
+                    filename,
                     name,
                     canonical_name,
                 )
                 continue
-            if tags.isdisjoint(tags_priorities):
-                continue
-            support_min = min(
+            priorities = [
                 tags_priorities[tag] for tag in tags if tag in tags_priorities
-            )
-            candidates.append((support_min, candidate))
+            ]
+            if priorities:
+                candidates.append((min(priorities), filename))
         if not candidates:
             return None
         return min(candidates, key=lambda x: x[0])[1]
 
+    def get(
+        self, link: Link, project_name: str | None, target_python: TargetPython
+    ) -> Path | None:
+        if not project_name:
+            return None
+        path = self.get_path_for_link(link, target_python)
+        if not path.exists():
+            return None
+        canonical_name = canonicalize_name(project_name)
+        tags_priorities = _get_tags_priorities(target_python)
+        best = self._find_best(
+            self._read_manifest(path), canonical_name, tags_priorities
+        )
+        if best is None or not path.joinpath(best).exists():
+            # The manifest may be stale or miss the wheels stored without
+            # add_wheel(), rebuild it from the directory content
+            best = self._find_best(
+                self._build_manifest(path), canonical_name, tags_priorities
+            )
+        return path / best if best is not None else None
+
 
 class SafeFileCache(BaseCache):
     """
     A file based cache which is safe to use even when the target directory may
     not be accessible or writable.
+
+    The modification time of an entry is refreshed on every read, so that the least
+    recently used entries can be evicted when the cache grows beyond ``max_size``.
+    The eviction runs at most once per ``GC_INTERVAL`` when the cache is closed,
+    so it doesn't slow down the requests in the middle of a command.
+
+    If ``compress`` is True, the entries are stored compressed with a small header
+    recording the codec, entries without the header are read as they are.
     """
 
-    def __init__(self, directory: str) -> None:
+    GC_MARKER = ".last-gc"
+    #: The minimal interval in seconds between two automatic collections
+    GC_INTERVAL = 3600
+    CODEC_HEADER = b"pdm-codec:"
+    CODECS: dict[bytes, Callable[[bytes], bytes]] = {b"zlib": zlib.decompress}
+    #: Archives are compressed already, they are stored as they are
+    ARCHIVE_SUFFIXES = (".whl", ".zip", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+    #: The magic bytes of zip, gzip, bzip2 and xz files
+    ARCHIVE_MAGICS = (b"PK\x03\x04", b"\x1f\x8b", b"BZh", b"\xfd7zXZ\x00")
+
+    def __init__(
+        self, directory: str, max_size: int = 0, compress: bool = False
+    ) -> None:
         super().__init__()
         self.directory = directory
+        self.max_size = max_size
+        self.compress = compress
+        self._gc_pending = False
+
+    def _is_archive(self, key: str, value: bytes) -> bool:
+        if urlparse(key).path.endswith(self.ARCHIVE_SUFFIXES):
+            return True
+        # The serialized response starts with a short header followed by the body
+        head = value[:64]
+        return any(magic in head for magic in self.ARCHIVE_MAGICS)
+
+    def _encode(self, key: str, value: bytes) -> bytes:
+        if not self.compress or self._is_archive(key, value):
+            return value
+        # Use the fastest level, most of the gain comes from the index pages
+        encoded = self.CODEC_HEADER + b"zlib\n" + zlib.compress(value, 1)
+        return encoded if len(encoded) < len(value) else value
+
+    def _decode(self, content: bytes) -> bytes | None:
+        if not content.startswith(self.CODEC_HEADER):
+            return content
+        codec, _, data = content[len(self.CODEC_HEADER) :].partition(b"\n")
+        if codec not in self.CODECS:
+            return None
+        try:
+            return self.CODECS[codec](data)
+        except zlib.error:
+            return None
 
     def _get_cache_path(self, name: str) -> str:
         # From cachecontrol.caches.file_cache.FileCache._fn, brought into our
@@ -256,16 +607,69 @@ class SafeFileCache(BaseCache):
         path = self._get_cache_path(key)
         with contextlib.suppress(OSError):
             with open(path, "rb") as f:
-                return f.read()
+                content = f.read()
+            with contextlib.suppress(OSError):
+                # Record the access time for LRU eviction
+                os.utime(path)
+            return self._decode(content)
+        return None
+
+    def get_size(self, key: str) -> int | None:
+        """Get the size of the stored entry without reading it"""
+        with contextlib.suppress(OSError):
+            return os.path.getsize(self._get_cache_path(key))
         return None
 
     def set(self, key: str, value: bytes, expires: int | None = None) -> None:
         path = self._get_cache_path(key)
+        value = self._encode(key, value)
         with contextlib.suppress(OSError):
             with atomic_open_for_write(path, mode="wb") as f:
                 cast(BinaryIO, f).write(value)
+        if self.max_size:
+            self._gc_pending = True
 
     def delete(self, key: str) -> None:
         path = self._get_cache_path(key)
         with contextlib.suppress(OSError):
             os.remove(path)
+
+    def close(self) -> None:
+        if self._gc_pending:
+            self._gc_pending = False
+            self._maybe_gc()
+
+    def _maybe_gc(self) -> None:
+        marker = os.path.join(self.directory, self.GC_MARKER)
+        with contextlib.suppress(OSError):
+            if time.time() - os.path.getmtime(marker) < self.GC_INTERVAL:
+                return
+        with contextlib.suppress(OSError):
+            Path(marker).touch()
+        self.gc(self.max_size)
+
+    def gc(self, max_size: int) -> tuple[int, int]:
+        """Evict the least recently used entries until the total size of the cache
+        is not greater than *max_size*.
+
+        :returns: a tuple of (number of removed files, number of freed bytes)
+        """
+        entries: list[tuple[float, int, str]] = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name == self.GC_MARKER:
+                    continue
+                path = os.path.join(root, name)
+                with contextlib.suppress(OSError):
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = freed = 0
+        for _, size, path in sorted(entries):
+            if total - freed <= max_size:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(path)
+                removed += 1
+                freed += size
+        return removed, freed
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import re
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, Iterable, cast, no_type_check
-from zipfile import ZipFile
+from urllib.parse import urlparse
+from zipfile import BadZipFile, ZipFile
 
+import requests
 from packaging.utils import parse_wheel_filename
 from unearth import Link, vcs_support
 
 from pdm import termui
 from pdm.builders import EditableBuilder, WheelBuilder
 from pdm.compat import importlib_metadata as im
-from pdm.exceptions import BuildError, CandidateNotFound
+from pdm.exceptions import BuildError, CandidateNotFound, OfflineError
+from pdm.models.finder import IndexLink
+from pdm.models.lazy_wheel import HTTPRangeRequestUnsupported, read_wheel_metadata
 from pdm.models.requirements import (
     FileRequirement,
     Requirement,
@@ -30,6 +35,7 @@ from pdm.utils import (
     expand_env_vars_in_auth,
     get_rev_from_url,
     get_venv_like_prefix,
+    is_path_relative_to,
     normalize_name,
     path_replace,
     path_to_url,
@@ -39,6 +45,7 @@ from pdm.utils import (
 if TYPE_CHECKING:
     from unearth import Package, PackageFinder
 
+    from pdm._types import Source
     from pdm.models.environment import Environment
 
 
@@ -250,6 +257,21 @@ class PreparedCandidate:
         )
         return Link(url)
 
+    def _get_link_sources(self) -> list[Source] | None:
+        """Return the sources the candidate link is collected from, or None if they
+        are unknown so that all sources of the project are used.
+        """
+        comes_from = getattr(self.candidate.link, "comes_from", None)
+        if not comes_from:
+            return None
+        comes_from = Link(comes_from).redacted
+        sources = [
+            source
+            for source in self.environment.project.sources
+            if comes_from.startswith(Link(source["url"]).redacted.rstrip("/"))
+        ]
+        return sources or None
+
     @cached_property
     def revision(self) -> str:
         if not (self._source_dir and os.path.exists(self._source_dir)):
@@ -309,14 +331,12 @@ class PreparedCandidate:
             )
             with self.environment.get_finder() as finder:
                 hash_cache = self.environment.project.make_hash_cache()
+                hash_value = hash_cache.get_hash(Link(url), finder.session)
+                hash_cache.commit()
                 return _filter_none(
                     {
                         "url": url_without_fragments(req.url),
-                        "archive_info": {
-                            "hash": hash_cache.get_hash(
-                                Link(url), finder.session
-                            ).replace(":", "=")
-                        },
+                        "archive_info": {"hash": hash_value.replace(":", "=")},
                         "subdirectory": req.subdirectory,
                     }
                 )
@@ -342,6 +362,9 @@ class PreparedCandidate:
         self.wheel = Path(
             builder.build(build_dir, metadata_directory=self._metadata_dir)
         )
+        wheel_cache = self.environment.project.make_wheel_cache()
+        if is_path_relative_to(self.wheel, wheel_cache.directory):
+            wheel_cache.add_wheel(self.wheel)
         return self.wheel
 
     def obtain(self, allow_all: bool = False) -> None:
@@ -401,9 +424,93 @@ class PreparedCandidate:
                     self._source_dir = Path(build_dir)
                     self._unpacked_dir = result
 
+    def _get_metadata_from_index(self, metadir_parent: str) -> im.Distribution | None:
+        """Fetch the core metadata file of the wheel if the index serves it,
+        as specified by PEP 658. Return None if it is not available.
+        """
+        link = self.candidate.link
+        if (
+            not isinstance(link, IndexLink)
+            or not link.dist_info_metadata
+            or not link.is_wheel
+            or self.link is None
+        ):
+            return None
+        metadata_url = f"{self.link.url_without_fragment}.metadata"
+        with self.environment.get_finder(self._get_link_sources()) as finder:
+            try:
+                resp = finder.session.get(metadata_url)
+            except OfflineError:
+                return None
+            if not resp.ok:
+                termui.logger.debug(
+                    "Failed to fetch metadata from %s: %s", metadata_url, resp.reason
+                )
+                return None
+            content = resp.content
+        if link.metadata_hash is not None:
+            hash_name, hash_value = link.metadata_hash
+            # The metadata can't be verified with an unknown hash algorithm either
+            if (
+                hash_name not in hashlib.algorithms_available
+                or hashlib.new(hash_name, content).hexdigest() != hash_value
+            ):
+                termui.logger.warning(
+                    "Hash mismatch for metadata file %s", metadata_url
+                )
+                return None
+        termui.logger.info("Using metadata file from the index: %s", metadata_url)
+        name, version, *_ = link.filename.split("-")
+        return self._write_metadata(
+            metadir_parent, f"{name}-{version}.dist-info", content
+        )
+
+    def _get_metadata_from_remote_wheel(
+        self, metadir_parent: str
+    ) -> im.Distribution | None:
+        """Read the metadata out of the remote wheel with HTTP range requests.
+        Return None if the server doesn't support them.
+        """
+        if (
+            self.link is None
+            or not self.link.is_wheel
+            or urlparse(self.link.url).scheme not in ("http", "https")
+        ):
+            return None
+        url = self.link.url_without_fragment
+        with self.environment.get_finder(self._get_link_sources()) as finder:
+            try:
+                dist_info, content = read_wheel_metadata(url, finder.session)
+            except (
+                HTTPRangeRequestUnsupported,
+                BadZipFile,
+                requests.RequestException,
+                OfflineError,
+            ) as e:
+                termui.logger.debug("Failed to read metadata from %s: %s", url, e)
+                return None
+        termui.logger.info("Read metadata from the remote wheel: %s", url)
+        return self._write_metadata(metadir_parent, dist_info, content)
+
+    @staticmethod
+    def _write_metadata(
+        metadir_parent: str, dist_info: str, content: bytes
+    ) -> im.Distribution:
+        path = Path(metadir_parent, dist_info)
+        path.mkdir(parents=True)
+        path.joinpath("METADATA").write_bytes(content)
+        return im.PathDistribution(path)
+
     def prepare_metadata(self) -> im.Distribution:
-        self.obtain(allow_all=True)
         metadir_parent = create_tracked_tempdir(prefix="pdm-meta-")
+        if not self.wheel and not self._source_dir:
+            # Avoid downloading the whole wheel if the metadata is served alone
+            result = self._get_metadata_from_index(
+                metadir_parent
+            ) or self._get_metadata_from_remote_wheel(metadir_parent)
+            if result is not None:
+                return result
+        self.obtain(allow_all=True)
         if self.wheel:
             # Get metadata from METADATA inside the wheel
             self._metadata_dir = _get_wheel_metadata_from_wheel(
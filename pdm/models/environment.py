@@ -7,6 +7,8 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import weakref
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Generator
@@ -16,6 +18,7 @@ import unearth
 from pdm import termui
 from pdm.exceptions import BuildError
 from pdm.models.auth import make_basic_auth
+from pdm.models.finder import PDMPackageFinder
 from pdm.models.in_process import (
     get_pep508_environment,
     get_python_abi_tag,
@@ -34,6 +37,7 @@ from pdm.utils import (
 
 if TYPE_CHECKING:
     from pdm._types import Source
+    from pdm.models.caches import IndexPageCache
     from pdm.project import Project
 
 
@@ -81,11 +85,16 @@ class Environment:
         """
         self.python_requires = project.python_requires
         self.project = project
-        self.interpreter = project.python
+        self.interpreter = self._get_interpreter()
         self.auth = make_basic_auth(
             self.project.sources,
             self.project.core.ui.verbosity >= termui.Verbosity.DETAIL,
         )
+        self._sessions: dict[tuple, PDMSession] = {}
+        self._session_lock = threading.Lock()
+
+    def _get_interpreter(self) -> PythonInfo:
+        return self.project.python
 
     def get_paths(self) -> dict[str, str]:
         """Get paths like ``sysconfig.get_paths()`` for installation."""
@@ -134,14 +143,9 @@ class Environment:
             sources = self.project.sources
 
         index_urls, find_links, trusted_hosts = get_index_urls(sources)
-        session = PDMSession(
-            cache_dir=self.project.cache("http"),
-            index_urls=index_urls,
-            trusted_hosts=trusted_hosts,
-        )
-        session.auth = self.auth
-        finder = unearth.PackageFinder(
-            session=session,
+        finder = PDMPackageFinder(
+            session=self._get_session(index_urls, trusted_hosts),
+            page_cache=self.index_page_cache,
             index_urls=index_urls,
             find_links=find_links,
             target_python=self.target_python,
@@ -153,15 +157,48 @@ class Environment:
             ),
             verbosity=self.project.core.ui.verbosity,
         )
-        try:
-            yield finder
-        finally:
-            session.close()
+        yield finder
+
+    @cached_property
+    def index_page_cache(self) -> IndexPageCache:
+        """The cache of the links parsed from index pages"""
+        return self.project.make_index_page_cache()
+
+    def _get_session(
+        self, index_urls: list[str], trusted_hosts: list[str]
+    ) -> PDMSession:
+        """Get the session shared by all finders with the same index URLs and
+        trusted hosts, which is created on the first call and kept alive along
+        with the environment so that the connections are reused.
+        """
+        key = (tuple(index_urls), tuple(trusted_hosts))
+        with self._session_lock:
+            if key not in self._sessions:
+                session = PDMSession(
+                    cache_dir=self.project.cache("http"),
+                    cache_max_size=self.project.config["cache.http.max_size"],
+                    cache_compress=self.project.config["cache.http.compress"],
+                    offline=self.project.config["offline"],
+                    max_connections=self.project.config["pypi.max_connections"],
+                    index_ttl=self.project.config["pypi.index_ttl"],
+                    stale_while_revalidate=self.project.config[
+                        "pypi.stale_while_revalidate"
+                    ],
+                    index_urls=index_urls,
+                    trusted_hosts=trusted_hosts,
+                )
+                session.auth = self.auth
+                weakref.finalize(self, session.close)
+                self._sessions[key] = session
+            return self._sessions[key]
 
     def get_working_set(self) -> WorkingSet:
         """Get the working set based on local packages directory."""
         paths = self.get_paths()
-        return WorkingSet([paths["platlib"], paths["purelib"]])
+        return WorkingSet(
+            [paths["platlib"], paths["purelib"]],
+            snapshot_file=self.project.cache("metadata") / "working_set.json",
+        )
 
     @cached_property
     def marker_environment(self) -> dict[str, str]:
@@ -266,14 +303,8 @@ class GlobalEnvironment(Environment):
 class BareEnvironment(Environment):
     """Bare environment that does not depend on project files."""
 
-    def __init__(self, project: Project) -> None:
-        self.python_requires = project.python_requires
-        self.project = project
-        self.interpreter = PythonInfo.from_path(sys.executable)
-        self.auth = make_basic_auth(
-            self.project.sources,
-            self.project.core.ui.verbosity >= termui.Verbosity.DETAIL,
-        )
+    def _get_interpreter(self) -> PythonInfo:
+        return PythonInfo.from_path(sys.executable)
 
     def get_working_set(self) -> WorkingSet:
         if self.project.project_config.config_file.exists():
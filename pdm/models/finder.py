@@ -0,0 +1,278 @@
+"""A package finder that keeps the extra attributes of the links on index pages."""
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+from typing import TYPE_CHECKING, Any, Iterable, cast
+from urllib import parse
+
+import unearth
+from unearth.collector import (
+    HTMLPage,
+    IndexHTMLParser,
+    LinkCollectError,
+    collect_links_from_location,
+)
+from unearth.session import PyPISession
+
+from pdm.termui import logger
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from pdm.models.caches import IndexPageCache
+
+SIMPLE_JSON_TYPE = "application/vnd.pypi.simple.v1+json"
+SIMPLE_HTML_TYPES = ("application/vnd.pypi.simple.v1+html", "text/html")
+#: The major version of the JSON simple API that is supported
+JSON_API_MAJOR_VERSION = "1"
+#: Prefer the JSON simple API and fall back to HTML(PEP 691)
+INDEX_ACCEPT = (
+    "application/vnd.pypi.simple.v1+json, "
+    "application/vnd.pypi.simple.v1+html; q=0.2, "
+    "text/html; q=0.01"
+)
+
+
+@dataclasses.dataclass(eq=False, repr=False)
+class IndexLink(unearth.Link):
+    """A link collected from an index page.
+
+    Args:
+        dist_info_metadata (str|None): The value of the PEP 658
+            ``data-dist-info-metadata`` attribute, which tells the core metadata
+            file is available at ``<url>.metadata``. It can be ``true`` or a hash
+            of the file like ``sha256=<hex>``.
+    """
+
+    dist_info_metadata: str | None = None
+
+    def as_json(self) -> dict[str, Any]:
+        result = super().as_json()
+        result["dist_info_metadata"] = self.dist_info_metadata
+        return result
+
+    @property
+    def metadata_hash(self) -> tuple[str, str] | None:
+        """The (name, value) of the hash of the metadata file if given"""
+        if not self.dist_info_metadata or "=" not in self.dist_info_metadata:
+            return None
+        name, _, value = self.dist_info_metadata.partition("=")
+        return name, value
+
+
+def parse_html_page(page: HTMLPage) -> Iterable[IndexLink]:
+    parser = IndexHTMLParser()
+    parser.feed(page.html)
+    base_url = parser.base_url or page.link.url_without_fragment
+    for anchor in parser.anchors:
+        href = anchor.get("href")
+        if href is None:
+            continue
+        url = parse.urljoin(base_url, href)
+        # data-core-metadata is the new name introduced by PEP 714
+        metadata = anchor.get("data-core-metadata") or anchor.get(
+            "data-dist-info-metadata"
+        )
+        yield IndexLink(
+            url,
+            base_url,
+            yank_reason=anchor.get("data-yanked"),
+            requires_python=anchor.get("data-requires-python"),
+            dist_info_metadata=metadata,
+        )
+
+
+def parse_json_page(
+    location: unearth.Link, data: dict[str, Any]
+) -> Iterable[IndexLink]:
+    """Parse the links from a JSON simple API response, as specified by PEP 691"""
+    base_url = location.url_without_fragment
+    for file in data.get("files", []):
+        url = parse.urljoin(base_url, file["url"])
+        hashes = file.get("hashes") or {}
+        if hashes and "#" not in url:
+            hash_name = "sha256" if "sha256" in hashes else next(iter(hashes))
+            url = f"{url}#{hash_name}={hashes[hash_name]}"
+        yanked = file.get("yanked", False)
+        if isinstance(yanked, str):
+            yank_reason: str | None = yanked
+        else:
+            yank_reason = "" if yanked else None
+        metadata = file.get("core-metadata", file.get("dist-info-metadata"))
+        if isinstance(metadata, dict):
+            metadata = next(
+                (f"{name}={value}" for name, value in metadata.items()), "true"
+            )
+        yield IndexLink(
+            url,
+            base_url,
+            yank_reason=yank_reason,
+            requires_python=file.get("requires-python") or None,
+            dist_info_metadata="true" if metadata is True else metadata or None,
+        )
+
+
+def _split_auth(url: str) -> tuple[str, str]:
+    """Split the URL into (userinfo, URL without the userinfo)"""
+    parsed = parse.urlsplit(url)
+    auth, _, netloc = parsed.netloc.rpartition("@")
+    return auth, parse.urlunsplit(parsed._replace(netloc=netloc))
+
+
+def _dump_links(links: Iterable[IndexLink], base_url: str) -> list[list[str | None]]:
+    def relative(url: str | None) -> str | None:
+        # Keep the credentials out of the cache, they are added back on loading
+        if url is None:
+            return None
+        if url.startswith(base_url):
+            return url[len(base_url) :]
+        return _split_auth(url)[1]
+
+    return [
+        [
+            relative(link.url),
+            relative(link.comes_from),
+            link.yank_reason,
+            link.requires_python,
+            link.dist_info_metadata,
+        ]
+        for link in links
+    ]
+
+
+def _load_links(data: list[list[str | None]], base_url: str) -> list[IndexLink]:
+    auth, base_without_auth = _split_auth(base_url)
+    base_netloc = parse.urlsplit(base_without_auth).netloc
+
+    def absolute(url: str) -> str:
+        url = parse.urljoin(base_url, url)
+        parsed = parse.urlsplit(url)
+        if auth and parsed.netloc == base_netloc:
+            # Add the credentials of the source back to the links of the same host
+            url = parse.urlunsplit(parsed._replace(netloc=f"{auth}@{base_netloc}"))
+        return url
+
+    return [
+        IndexLink(
+            absolute(cast(str, url)),
+            absolute(comes_from) if comes_from is not None else None,
+            yank_reason=yank_reason,
+            requires_python=requires_python,
+            dist_info_metadata=dist_info_metadata,
+        )
+        for url, comes_from, yank_reason, requires_python, dist_info_metadata in data
+    ]
+
+
+def _check_for_status(resp: Response) -> None:
+    if 400 <= resp.status_code < 500:
+        raise LinkCollectError(f"Client Error({resp.status_code}): {resp.reason}")
+    if 500 <= resp.status_code < 600:
+        raise LinkCollectError(f"Server Error({resp.status_code}): {resp.reason}")
+
+
+def collect_links_from_index(
+    session: PyPISession,
+    location: unearth.Link,
+    page_cache: IndexPageCache | None = None,
+) -> Iterable[unearth.Link]:
+    """Collect package links from an index page, preferring the JSON simple API
+    and falling back to the HTML one.
+
+    If ``page_cache`` is given, the links parsed from a response are saved in it,
+    and are reused as long as the validator of the response doesn't change.
+    """
+    if location.is_file and location.file_path.is_dir():
+        return collect_links_from_location(session, location)
+    if not session.is_secure_origin(location):
+        return []
+    resp = session.get(
+        location.normalized,
+        headers={"Accept": INDEX_ACCEPT, "Cache-Control": "max-age=0"},
+    )
+    try:
+        _check_for_status(resp)
+    except LinkCollectError as e:
+        logger.warning("Skip %s because of %s.", location.redacted, e)
+        return []
+    content_type = resp.headers.get("content-type", "").lower()
+    etag = resp.headers.get("etag") or resp.headers.get("last-modified")
+    validator = f"{content_type};{etag}" if etag else None
+    base_url = location.url_without_fragment
+    if page_cache is not None and validator is not None:
+        with contextlib.suppress(KeyError):
+            cached = page_cache.get(location)
+            if cached["validator"] == validator:
+                return _load_links(cached["links"], base_url)
+    if content_type.startswith(SIMPLE_JSON_TYPE):
+        try:
+            data = resp.json()
+        except ValueError:
+            logger.debug(
+                "Failed to decode the JSON response of %s, parse it as HTML",
+                location.redacted,
+            )
+            links = list(parse_html_page(HTMLPage(location, resp.text)))
+        else:
+            api_version = str(data.get("meta", {}).get("api-version", "1.0"))
+            if api_version.split(".")[0] != JSON_API_MAJOR_VERSION:
+                logger.warning(
+                    "Skip %s because of unsupported API version %s.",
+                    location.redacted,
+                    api_version,
+                )
+                return []
+            links = list(parse_json_page(location, data))
+    elif content_type.startswith(SIMPLE_HTML_TYPES):
+        links = list(parse_html_page(HTMLPage(location, resp.text)))
+    else:
+        logger.warning(
+            "Skip %s because of unsupported content-type %s.",
+            location.redacted,
+            content_type,
+        )
+        return []
+    if page_cache is not None and validator is not None:
+        page_cache.set(
+            location, {"validator": validator, "links": _dump_links(links, base_url)}
+        )
+    return links
+
+
+class PDMPackageFinder(unearth.PackageFinder):
+    """A package finder that collects links from index pages with
+    :func:`collect_links_from_index`.
+
+    unearth has no public hook to collect the links, so it overrides the private
+    ``_find_packages`` method. The version of unearth is pinned for it and
+    ``test_unearth_finder_private_api`` checks the members it relies on.
+
+    :param page_cache: the cache of the links parsed from index pages
+    """
+
+    def __init__(
+        self, *args: Any, page_cache: IndexPageCache | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.page_cache = page_cache
+
+    def _find_packages(
+        self,
+        package_name: str,
+        allow_yanked: bool = False,
+        hashes: dict[str, list[str]] | None = None,
+    ) -> Iterable[unearth.Package]:
+        evaluator = self.build_evaluator(package_name, allow_yanked, hashes)
+        for index_url in self.index_urls:
+            package_link = self._build_index_page_link(index_url, package_name)
+            yield from self._evaluate_links(
+                collect_links_from_index(self.session, package_link, self.page_cache),
+                evaluator,
+            )
+        for find_link in self.find_links:
+            link = self._build_find_link(find_link)
+            yield from self._evaluate_links(
+                collect_links_from_location(self.session, link, expand=True),
+                evaluator,
+            )
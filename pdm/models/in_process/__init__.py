@@ -6,7 +6,7 @@ import json
 import os
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 FOLDER_PATH = Path(__file__).parent
 
@@ -41,3 +41,11 @@ def parse_setup_py(executable: str, path: str) -> Dict[str, Any]:
     """Parse setup.py and return the kwargs"""
     cmd = [executable, "-Es", str(FOLDER_PATH / "parse_setup.py"), path]
     return json.loads(subprocess.check_output(cmd))
+
+
+def compile_files(executable: str, files: List[str]) -> Dict[str, str]:
+    """Byte-compile the files in a process pool with the interpreter, return a map
+    of the compiled files to their cache files.
+    """
+    cmd = [executable, "-Es", str(FOLDER_PATH / "compile_files.py")]
+    return json.loads(subprocess.check_output(cmd, input=json.dumps(files).encode()))
@@ -0,0 +1,30 @@
+import json
+import os
+import py_compile
+import sys
+
+
+def compile_file(path):
+    try:
+        return path, py_compile.compile(path, doraise=True)
+    except (py_compile.PyCompileError, OSError):
+        return path, None
+
+
+def main():
+    files = json.load(sys.stdin)
+    workers = os.cpu_count() or 1
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as executor:
+            chunksize = max(len(files) // (workers * 4), 1)
+            results = list(executor.map(compile_file, files, chunksize=chunksize))
+    except (ImportError, OSError, NotImplementedError):
+        # The process pool isn't available on this platform
+        results = [compile_file(path) for path in files]
+    json.dump({path: cache for path, cache in results if cache}, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
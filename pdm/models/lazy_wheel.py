@@ -0,0 +1,132 @@
+"""Read files from a remote wheel with HTTP range requests, so that the metadata
+can be got without downloading the whole wheel.
+"""
+from __future__ import annotations
+
+import io
+import re
+import zipfile
+
+import requests
+
+#: The minimum size of a range to fetch, it is large enough to contain the central
+#: directory of most wheels and the local header and METADATA file read after it.
+MIN_FETCH_SIZE = 64 * 1024
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+class HTTPRangeRequestUnsupported(Exception):
+    pass
+
+
+class LazyRemoteFile(io.RawIOBase):
+    """A seekable, read-only file whose content is fetched on demand with
+    HTTP range requests.
+
+    :param url: the URL of the remote file
+    :param session: the requests session to send requests with
+    :raises HTTPRangeRequestUnsupported: if the server doesn't honor range requests
+    """
+
+    def __init__(self, url: str, session: requests.Session) -> None:
+        self.url = url
+        self.session = session
+        self._pos = 0
+        # Fetched chunks of (start offset, content), sorted by start offset
+        self._chunks: list[tuple[int, bytes]] = []
+        # Fetch the tail first because that is where the central directory of a
+        # zip file is, and the response tells the length of the whole file.
+        start, content, self._length = self._request(f"bytes=-{MIN_FETCH_SIZE}")
+        self._chunks.append((start, content))
+
+    def _request(self, range_header: str) -> tuple[int, bytes, int]:
+        resp = self.session.get(
+            self.url,
+            headers={"Range": range_header, "Accept-Encoding": "identity"},
+            stream=True,
+        )
+        with resp:
+            resp.raise_for_status()
+            match = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", ""))
+            if resp.status_code != 206 or match is None:
+                raise HTTPRangeRequestUnsupported(
+                    f"Range request is not supported by {self.url}"
+                )
+            return int(match.group(1)), resp.content, int(match.group(3))
+
+    def _missing_ranges(self, start: int, end: int) -> list[tuple[int, int]]:
+        result: list[tuple[int, int]] = []
+        for chunk_start, content in self._chunks:
+            chunk_end = chunk_start + len(content)
+            if chunk_end <= start:
+                continue
+            if chunk_start >= end:
+                break
+            if chunk_start > start:
+                result.append((start, chunk_start))
+            start = max(start, chunk_end)
+        if start < end:
+            result.append((start, end))
+        return result
+
+    def _ensure(self, start: int, end: int) -> None:
+        for missing_start, missing_end in self._missing_ranges(start, end):
+            missing_end = min(
+                max(missing_end, missing_start + MIN_FETCH_SIZE), self._length
+            )
+            fetched = self._request(f"bytes={missing_start}-{missing_end - 1}")[:2]
+            self._chunks.append(fetched)
+        self._chunks.sort(key=lambda chunk: chunk[0])
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._length
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore[override]
+        start = self._pos
+        end = min(start + len(buffer), self._length)
+        if start >= end:
+            return 0
+        self._ensure(start, end)
+        view = memoryview(buffer)
+        for chunk_start, content in self._chunks:
+            chunk_end = chunk_start + len(content)
+            if chunk_end <= start or chunk_start >= end:
+                continue
+            lo, hi = max(start, chunk_start), min(end, chunk_end)
+            view[lo - start : hi - start] = content[lo - chunk_start : hi - chunk_start]
+        self._pos = end
+        return end - start
+
+
+def read_wheel_metadata(url: str, session: requests.Session) -> tuple[str, bytes]:
+    """Read the METADATA file from a remote wheel.
+
+    :returns: a tuple of the name of the .dist-info directory and the content
+    :raises HTTPRangeRequestUnsupported: if the server doesn't honor range requests
+    :raises zipfile.BadZipFile: if the file is not a valid wheel
+    """
+    with LazyRemoteFile(url, session) as fp, zipfile.ZipFile(fp) as zf:  # type: ignore
+        for name in zf.namelist():
+            parts = name.split("/")
+            if (
+                len(parts) == 2
+                and parts[0].endswith(".dist-info")
+                and parts[1] == "METADATA"
+            ):
+                return parts[0], zf.read(name)
+    raise zipfile.BadZipFile(f"No .dist-info/METADATA is found in {url}")
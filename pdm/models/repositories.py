@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import copy
 import dataclasses
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache, wraps
 from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, TypeVar, cast
 
@@ -20,6 +23,8 @@ from pdm.models.specifiers import PySpecSet
 from pdm.utils import normalize_name, url_without_fragments
 
 if TYPE_CHECKING:
+    from unearth import Package
+
     from pdm._types import CandidateInfo, SearchResult, Source
     from pdm.models.environment import Environment
 
@@ -32,10 +37,19 @@ def cache_result(
 ) -> Callable[[T, Candidate], CandidateInfo]:
     @wraps(func)
     def wrapper(self: T, candidate: Candidate) -> CandidateInfo:
+        # A pinned candidate is looked up before it gets a link from preparing,
+        # so also store the result under the key it is looked up with.
+        pinned = (
+            copy.copy(candidate)
+            if candidate.link is None and candidate.name and candidate.version
+            else None
+        )
         result = func(self, candidate)
         prepared = candidate.prepared
         if prepared and prepared.should_cache():
             self._candidate_info_cache.set(candidate, result)
+            if pinned is not None:
+                self._candidate_info_cache.set(pinned, result)
         return result
 
     return wrapper
@@ -189,7 +203,7 @@ class BaseRepository:
         summary = prepared.metadata.metadata["Summary"]
         return deps, requires_python, summary
 
-    def get_hashes(self, candidate: Candidate) -> dict[str, str] | None:
+    def get_hashes(self, candidate: Candidate) -> dict[Link, str] | None:
         """Get hashes of all possible installable candidates
         of a given package version.
         """
@@ -206,14 +220,27 @@ class BaseRepository:
             matching_candidates: Iterable[Candidate] = [candidate]
         else:
             matching_candidates = self.find_candidates(req, ignore_requires_python=True)
-        result: dict[str, str] = {}
-        with self.environment.get_finder(self.sources) as finder:
-            for c in matching_candidates:
-                # Prepare the candidate to replace vars in the link URL
-                link = c.prepare(self.environment).link
-                if not link or link.is_vcs:
-                    continue
-                result[link] = self._hash_cache.get_hash(link, finder.session)
+        links: list[Link] = []
+        for c in matching_candidates:
+            # Prepare the candidate to replace vars in the link URL
+            link = c.prepare(self.environment).link
+            if not link or link.is_vcs:
+                continue
+            links.append(link)
+        # Resolve all cached hashes in one query, only the missing ones
+        # need to be read from the network.
+        cached = self._hash_cache.get_many(link.url_without_fragment for link in links)
+        result: dict[Link, str] = {}
+        missing: list[Link] = []
+        for link in links:
+            if link.url_without_fragment in cached:
+                result[link] = cached[link.url_without_fragment]
+            else:
+                missing.append(link)
+        if missing:
+            with self.environment.get_finder(self.sources) as finder:
+                for link in missing:
+                    result[link] = self._hash_cache.get_hash(link, finder.session)
         return result or None
 
     def dependency_generators(self) -> Iterable[Callable[[Candidate], CandidateInfo]]:
@@ -222,6 +249,23 @@ class BaseRepository:
         """
         raise NotImplementedError
 
+    def commit_caches(self) -> None:
+        """Write the cache entries collected during resolution to the disk."""
+        self._candidate_info_cache.commit()
+        self._hash_cache.commit()
+        self.environment.index_page_cache.commit()
+
+    def prefetch(self, requirements: Iterable[Requirement]) -> None:
+        """Start fetching the candidates of the given requirements in the
+        background, so that they are ready when the resolver asks for them.
+        Do nothing by default.
+        """
+
+    def stop_prefetch(self) -> None:
+        """Cancel the fetches started by :meth:`prefetch` that have not started
+        yet. Do nothing by default.
+        """
+
     def search(self, query: str) -> SearchResult:
         """Search package by name or summary.
 
@@ -236,6 +280,12 @@ class PyPIRepository(BaseRepository):
 
     DEFAULT_INDEX_URL = "https://pypi.org"
 
+    def __init__(self, sources: list[Source], environment: Environment) -> None:
+        super().__init__(sources, environment)
+        self._packages_futures: dict[tuple, Future[list[Package]]] = {}
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+
     @cache_result
     def _get_dependencies_from_json(self, candidate: Candidate) -> CandidateInfo:
         if not candidate.name or not candidate.version:
@@ -276,18 +326,54 @@ class PyPIRepository(BaseRepository):
 
     def dependency_generators(self) -> Iterable[Callable[[Candidate], CandidateInfo]]:
         yield self._get_dependencies_from_cache
-        if self.environment.project.config["pypi.json_api"]:
+        config = self.environment.project.config
+        if config["pypi.json_api"] and not config["offline"]:
             yield self._get_dependencies_from_json
         yield self._get_dependencies_from_metadata
 
+    def _fetch_packages(self, name: str, sources: list[Source]) -> list[Package]:
+        with self.environment.get_finder(sources, True) as finder:
+            return finder.find_all_packages(name)
+
+    def _get_packages_future(self, requirement: Requirement) -> Future[list[Package]]:
+        sources = self.get_filtered_sources(requirement)
+        key = (
+            normalize_name(cast(str, requirement.project_name)),
+            tuple(source["url"] for source in sources),
+        )
+        with self._prefetch_lock:
+            if key not in self._packages_futures:
+                if self._prefetch_executor is None:
+                    self._prefetch_executor = ThreadPoolExecutor(
+                        self.environment.project.config["pypi.max_connections"]
+                    )
+                self._packages_futures[key] = self._prefetch_executor.submit(
+                    self._fetch_packages, cast(str, requirement.project_name), sources
+                )
+            return self._packages_futures[key]
+
+    def prefetch(self, requirements: Iterable[Requirement]) -> None:
+        for req in requirements:
+            if req.is_named:
+                self._get_packages_future(req)
+
+    def stop_prefetch(self) -> None:
+        with self._prefetch_lock:
+            # Cancel the pending futures one by one, since ``cancel_futures``
+            # of ``shutdown()`` is not available before Python 3.9.
+            for key, future in list(self._packages_futures.items()):
+                if future.cancel():
+                    del self._packages_futures[key]
+            if self._prefetch_executor is not None:
+                self._prefetch_executor.shutdown(wait=False)
+                self._prefetch_executor = None
+
     @lru_cache()
     def _find_candidates(self, requirement: Requirement) -> Iterable[Candidate]:
-        sources = self.get_filtered_sources(requirement)
-        with self.environment.get_finder(sources, True) as finder:
-            cans = [
-                Candidate.from_installation_candidate(c, requirement)
-                for c in finder.find_all_packages(requirement.project_name)
-            ]
+        cans = [
+            Candidate.from_installation_candidate(c, requirement)
+            for c in self._get_packages_future(requirement).result()
+        ]
         if not cans:
             raise CandidateNotFound(
                 f"Unable to find candidates for {requirement.project_name}. There may "
@@ -332,8 +418,12 @@ class LockedRepository(BaseRepository):
     ) -> None:
         super().__init__(sources, environment)
         self.packages: dict[tuple, Candidate] = {}
-        self.file_hashes: dict[tuple[str, str], dict[str, str]] = {}
+        self.file_hashes: dict[tuple[str, str], dict[Link, str]] = {}
         self.candidate_info: dict[tuple, CandidateInfo] = {}
+        # Keys of the candidates grouped by identifier, and the parsed
+        # requires-python of each, to look up candidates without scanning
+        self._keys_by_identifier: dict[str, list[tuple]] = {}
+        self._requires_python: dict[tuple, PySpecSet] = {}
         self._read_lockfile(lockfile)
 
     @property
@@ -341,16 +431,19 @@ class LockedRepository(BaseRepository):
         return {can.req.identify(): can for can in self.packages.values()}
 
     def _read_lockfile(self, lockfile: Mapping[str, Any]) -> None:
+        # Most packages share a few requires-python strings, parse each only once
+        python_specs: dict[str, PySpecSet] = {}
         for package in lockfile.get("package", []):
+            # The lockfile data is shared, don't modify it in place
             version = package.get("version")
-            if version:
-                package["version"] = f"=={version}"
-            package_name = package.pop("name")
+            package_name = package["name"]
             req_dict = {
                 k: v
                 for k, v in package.items()
-                if k not in ("dependencies", "requires_python", "summary")
+                if k not in ("name", "dependencies", "requires_python", "summary")
             }
+            if version:
+                req_dict["version"] = f"=={version}"
             req = Requirement.from_req_dict(package_name, req_dict)
             can = Candidate(req, name=package_name, version=version)
             can_id = self._identify_candidate(can)
@@ -361,6 +454,11 @@ class LockedRepository(BaseRepository):
                 package.get("summary", ""),
             )
             self.candidate_info[can_id] = candidate_info
+            requires_python = candidate_info[1]
+            if requires_python not in python_specs:
+                python_specs[requires_python] = PySpecSet(requires_python)
+            self._requires_python[can_id] = python_specs[requires_python]
+            self._keys_by_identifier.setdefault(can_id[0], []).append(can_id)
 
         for key, hashes in lockfile.get("metadata", {}).get("files", {}).items():
             self.file_hashes[tuple(key.split(None, 1))] = {  # type: ignore
@@ -400,20 +498,17 @@ class LockedRepository(BaseRepository):
         allow_prereleases: bool | None = None,
         ignore_requires_python: bool = False,
     ) -> Iterable[Candidate]:
-        for key, info in self.candidate_info.items():
-            if key[0] != requirement.identify():
-                continue
-            if not PySpecSet(info[1]).contains(
-                str(self.environment.interpreter.version), True
-            ):
+        python_version = str(self.environment.interpreter.version)
+        for key in self._keys_by_identifier.get(requirement.identify(), []):
+            if not self._requires_python[key].contains(python_version, True):
                 continue
             can = self.packages[key]
-            can.requires_python = info[1]
+            can.requires_python = self.candidate_info[key][1]
             can.prepare(self.environment)
             can.req = requirement
             yield can
 
-    def get_hashes(self, candidate: Candidate) -> dict[str, str] | None:
+    def get_hashes(self, candidate: Candidate) -> dict[Link, str] | None:
         assert candidate.name
         return self.file_hashes.get(
             (normalize_name(candidate.name), candidate.version or "")
@@ -1,30 +1,192 @@
+from __future__ import annotations
+
+import calendar
 import functools
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from email.utils import parsedate_tz
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from cachecontrol.adapter import CacheControlAdapter
+from requests import PreparedRequest, Response
+from requests.adapters import DEFAULT_POOLSIZE
 from requests_toolbelt.utils import user_agent
 from unearth.session import InsecureMixin, PyPISession
+from urllib3 import HTTPResponse
 
 from pdm.__version__ import __version__
+from pdm.exceptions import OfflineError
+from pdm.termui import logger
+
+
+class PDMCacheAdapter(CacheControlAdapter):
+    """A cache adapter that serves the cached index pages younger than
+    ``index_ttl`` seconds without revalidating them.
+
+    If ``revalidate_executor`` is given, older index pages are also served
+    from the cache immediately, and revalidated in the executor.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        index_ttl: int = 0,
+        revalidate_executor: Executor | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.index_ttl = index_ttl
+        self.revalidate_executor = revalidate_executor
+        self._revalidating: dict[str, Future[None]] = {}
+        self._revalidating_lock = threading.Lock()
+
+    @staticmethod
+    def _is_index_page(request: PreparedRequest) -> bool:
+        return request.method == "GET" and "text/html" in request.headers.get(
+            "Accept", ""
+        )
+
+    def _get_cached_index_page(
+        self, request: PreparedRequest
+    ) -> tuple[HTTPResponse, float] | None:
+        cache_url = self.controller.cache_url(request.url)
+        cached_response = self.controller.serializer.loads(
+            request, self.cache.get(cache_url)
+        )
+        if cached_response is None or "date" not in cached_response.headers:
+            return None
+        date = parsedate_tz(cached_response.headers["date"])
+        if date is None:
+            return None
+        return cached_response, time.time() - calendar.timegm(date[:6])
 
+    def _revalidate(self, request: PreparedRequest, **kwargs: Any) -> None:
+        try:
+            with super().send(request, **kwargs) as resp:
+                # Read the content to get it cached
+                resp.content
+        except Exception as e:
+            logger.debug("Failed to revalidate %s: %s", request.url, e)
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.pop(cast(str, request.url), None)
 
-class InsecureCacheControlAdapter(InsecureMixin, CacheControlAdapter):
+    def cancel_revalidations(self) -> None:
+        """Cancel the revalidations that have not started yet."""
+        with self._revalidating_lock:
+            for future in self._revalidating.values():
+                future.cancel()
+            self._revalidating.clear()
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        if (self.index_ttl or self.revalidate_executor) and self._is_index_page(
+            request
+        ):
+            cached = self._get_cached_index_page(request)
+            if cached is not None:
+                cached_response, age = cached
+                if age < self.index_ttl:
+                    return self.build_response(
+                        request, cached_response, from_cache=True
+                    )
+                if self.revalidate_executor is not None:
+                    url = cast(str, request.url)
+                    with self._revalidating_lock:
+                        if url not in self._revalidating:
+                            self._revalidating[url] = self.revalidate_executor.submit(
+                                self._revalidate, request.copy(), **kwargs
+                            )
+                    return self.build_response(
+                        request, cached_response, from_cache=True
+                    )
+        return super().send(request, *args, **kwargs)
+
+
+class InsecureCacheControlAdapter(InsecureMixin, PDMCacheAdapter):
     pass
 
 
+class OfflineCacheAdapter(CacheControlAdapter):
+    """An adapter that serves responses from the cache only, no matter whether
+    they are fresh or not, and fails immediately on cache misses.
+    """
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        cached_response = None
+        if request.method in self.cacheable_methods:
+            cache_url = self.controller.cache_url(request.url)
+            cached_response = self.controller.serializer.loads(
+                request, self.cache.get(cache_url)
+            )
+        if cached_response is None:
+            raise OfflineError(
+                f"{request.url} is not found in the cache while running offline"
+            )
+        return self.build_response(request, cached_response, from_cache=True)
+
+
 class PDMSession(PyPISession):
-    def __init__(self, *, cache_dir: Path, **kwargs: Any) -> None:
+    #: The number of threads to revalidate stale index pages in the background
+    REVALIDATE_WORKERS = 4
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path,
+        cache_max_size: int = 0,
+        cache_compress: bool = False,
+        offline: bool = False,
+        max_connections: int = DEFAULT_POOLSIZE,
+        index_ttl: int = 0,
+        stale_while_revalidate: bool = False,
+        **kwargs: Any,
+    ) -> None:
         from pdm.models.caches import SafeFileCache
 
-        cache = SafeFileCache(str(cache_dir))
-        self.secure_adapter_cls = functools.partial(CacheControlAdapter, cache=cache)
-        self.insecure_adapter_cls = functools.partial(
-            InsecureCacheControlAdapter, cache=cache
+        self._revalidate_executor: ThreadPoolExecutor | None = None
+        cache = SafeFileCache(
+            str(cache_dir), max_size=cache_max_size, compress=cache_compress
         )
+        # Block when all connections to a host are in use, instead of opening
+        # extra ones that are discarded afterwards.
+        adapter_kwargs = dict(
+            cache=cache, pool_maxsize=max_connections, pool_block=True
+        )
+        if offline:
+            adapter_cls = functools.partial(OfflineCacheAdapter, **adapter_kwargs)
+            self.secure_adapter_cls = adapter_cls
+            self.insecure_adapter_cls = adapter_cls  # type: ignore
+        else:
+            if stale_while_revalidate:
+                self._revalidate_executor = ThreadPoolExecutor(
+                    self.REVALIDATE_WORKERS, thread_name_prefix="pdm-revalidate"
+                )
+            adapter_kwargs.update(
+                index_ttl=index_ttl, revalidate_executor=self._revalidate_executor
+            )
+            self.secure_adapter_cls = functools.partial(
+                PDMCacheAdapter, **adapter_kwargs
+            )
+            self.insecure_adapter_cls = functools.partial(  # type: ignore
+                InsecureCacheControlAdapter, **adapter_kwargs
+            )
+        self.offline = offline
         super().__init__(**kwargs)
         self.headers["User-Agent"] = self._make_user_agent()
 
+    def close(self) -> None:
+        # Finish the running revalidations before the adapters are closed,
+        # so that the responses are written to the cache completely.
+        for adapter in self.adapters.values():
+            if isinstance(adapter, PDMCacheAdapter):
+                adapter.cancel_revalidations()
+        if self._revalidate_executor is not None:
+            self._revalidate_executor.shutdown(wait=True)
+            self._revalidate_executor = None
+        super().close()
+
     def _make_user_agent(self) -> str:
         return (
             user_agent.UserAgentBuilder("pdm", __version__)
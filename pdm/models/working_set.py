@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import itertools
+import os
 import sys
 from pathlib import Path
-from typing import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping
 
 from pdm.compat import importlib_metadata as im
 from pdm.utils import normalize_name
 
+if TYPE_CHECKING:
+    from pdm.models.caches import JSONFileCache
+
 default_context = im.DistributionFinder.Context()
 
 
@@ -62,16 +67,104 @@ def distributions(path: list[str]) -> Iterable[im.Distribution]:
     return itertools.chain.from_iterable(resolver(context) for resolver in resolvers)
 
 
+#: The distributions found in each directory, keyed by the directory path and
+#: invalidated when the digest of the metadata directories listed in it changes.
+_directory_snapshots: dict[str, tuple[str, dict[str, str]]] = {}
+
+
+def _read_name_header(path: str) -> str | None:
+    for filename in ("METADATA", "PKG-INFO"):
+        try:
+            with open(os.path.join(path, filename), encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("Name:"):
+                        return line[5:].strip()
+                    if not line.strip():  # The end of the headers
+                        break
+        except OSError:
+            continue
+    return None
+
+
+def _scan_directory(
+    path: str, snapshots: JSONFileCache[str, list] | None = None
+) -> dict[str, str]:
+    """Map the normalized names to the metadata directories in the path.
+
+    The names are read from the directory names like ``<name>-<version>.dist-info``,
+    only when it is escaped with underscores the ``Name`` header is read, since
+    it can't be told whether the original name contains dots or dashes.
+
+    The result is also saved in ``snapshots`` if given, to be reused by later
+    processes.
+    """
+    # A distribution can be replaced without changing the mtime of the directory
+    # within its resolution, so the listing is compared instead.
+    listing = sorted(
+        name
+        for name in os.listdir(path)
+        if os.path.splitext(name)[1].lower() in (".dist-info", ".egg-info")
+    )
+    digest = hashlib.sha1("\n".join(listing).encode()).hexdigest()
+    snapshot = _directory_snapshots.get(path)
+    if snapshot is None and snapshots is not None and path in snapshots:
+        saved_digest, saved_result = snapshots.get(path)
+        snapshot = (saved_digest, saved_result)
+    if snapshot is not None and snapshot[0] == digest:
+        _directory_snapshots[path] = snapshot
+        return snapshot[1]
+    result: dict[str, str] = {}
+    for dirname in listing:
+        dist_path = os.path.join(path, dirname)
+        name = os.path.splitext(dirname)[0].split("-", 1)[0]
+        if "_" in name:
+            name = _read_name_header(dist_path) or name
+        result[normalize_name(name)] = dist_path
+    _directory_snapshots[path] = (digest, result)
+    if snapshots is not None:
+        snapshots.set(path, [digest, result])
+    return result
+
+
 class WorkingSet(Mapping[str, im.Distribution]):
-    """A dictionary of currently installed distributions"""
+    """A dictionary of currently installed distributions.
+
+    The distributions in directories are indexed by the names of their metadata
+    directories, and the metadata is only parsed when it is accessed.
+
+    :param paths: the paths to look for distributions, defaults to ``sys.path``
+    :param snapshot_file: the file to save the index of each directory in, so that
+        it can be reused by later commands
+    """
+
+    def __init__(
+        self, paths: list[str] | None = None, snapshot_file: Path | None = None
+    ):
+        from pdm.models.caches import JSONFileCache
 
-    def __init__(self, paths: list[str] | None = None):
         if paths is None:
             paths = sys.path
-        self._dist_map = {
-            normalize_name(dist.metadata["Name"]): dist
-            for dist in distributions(path=paths)
-        }
+        snapshots: JSONFileCache[str, list] | None = (
+            JSONFileCache(snapshot_file) if snapshot_file is not None else None
+        )
+        self._dist_map: dict[str, im.Distribution] = {}
+        for path in paths:
+            if os.path.isdir(path):
+                self._dist_map.update(
+                    (name, im.PathDistribution(Path(dist_path)))
+                    for name, dist_path in _scan_directory(path, snapshots).items()
+                )
+            else:
+                self._dist_map.update(
+                    (normalize_name(dist.metadata["Name"]), dist)
+                    for dist in distributions(path=[path])
+                )
+        self._dist_map.update(
+            (normalize_name(dist.metadata["Name"]), dist)
+            for dist in EgglinkFinder.find_distributions(
+                im.DistributionFinder.Context(path=paths)
+            )
+        )
 
     def __getitem__(self, key: str) -> im.Distribution:
         return self._dist_map[key]
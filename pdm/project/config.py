@@ -3,6 +3,7 @@ from __future__ import annotations
 import collections
 import dataclasses
 import os
+import re
 from pathlib import Path
 from typing import Any, Callable, Iterator, Mapping, MutableMapping, TypeVar
 
@@ -69,6 +70,17 @@ def ensure_boolean(val: Any) -> bool:
     return bool(val) and val.lower() not in ("false", "no", "0")
 
 
+def parse_size(val: Any) -> int:
+    """Parse a size like 500MB or 2GB into the number of bytes"""
+    if isinstance(val, int):
+        return val
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*$", str(val), re.I)
+    if not match:
+        raise ValueError(f"Invalid size: {val}")
+    number, unit = match.groups()
+    return int(float(number) * 1024 ** ("", "k", "m", "g", "t").index(unit.lower()))
+
+
 DEFAULT_PYPI_INDEX = "https://pypi.org/simple"
 
 
@@ -107,6 +119,21 @@ class Config(MutableMapping[str, str]):
             platformdirs.user_cache_dir("pdm"),
             True,
         ),
+        "cache.http.max_size": ConfigItem(
+            "The size budget of the HTTP cache, like 500MB or 2GB. "
+            "The least recently used entries are evicted beyond it, 0 means no limit",
+            0,
+            True,
+            env_var="PDM_HTTP_CACHE_MAX_SIZE",
+            coerce=parse_size,
+        ),
+        "cache.http.compress": ConfigItem(
+            "Compress the HTTP cache entries to save disk space and I/O",
+            False,
+            True,
+            env_var="PDM_HTTP_CACHE_COMPRESS",
+            coerce=ensure_boolean,
+        ),
         "check_update": ConfigItem(
             "Check if there is any newer version available",
             True,
@@ -114,6 +141,12 @@ class Config(MutableMapping[str, str]):
             env_var="PDM_CHECK_UPDATE",
             coerce=ensure_boolean,
         ),
+        "offline": ConfigItem(
+            "Never touch the network and only read from the local caches",
+            False,
+            env_var="PDM_OFFLINE",
+            coerce=ensure_boolean,
+        ),
         "build_isolation": ConfigItem(
             "Isolate build environment from the project environment",
             True,
@@ -162,6 +195,12 @@ class Config(MutableMapping[str, str]):
             env_var="PDM_RESOLVE_MAX_ROUNDS",
             coerce=int,
         ),
+        "strategy.speculative_candidates": ConfigItem(
+            "The number of top candidates whose dependencies are fetched ahead",
+            2,
+            env_var="PDM_SPECULATIVE_CANDIDATES",
+            coerce=int,
+        ),
         "install.parallel": ConfigItem(
             "Whether to perform installation and uninstallation in parallel",
             True,
@@ -180,6 +219,42 @@ class Config(MutableMapping[str, str]):
             "symlink",
             replace="feature.install_cache_method",
         ),
+        "install.compile": ConfigItem(
+            "Byte-compile the installed packages in a process pool after syncing",
+            False,
+            env_var="PDM_INSTALL_COMPILE",
+            coerce=ensure_boolean,
+        ),
+        "install.max_workers": ConfigItem(
+            "The number of workers of each stage of parallel installation",
+            min(os.cpu_count() or 1, 8),
+            env_var="PDM_INSTALL_MAX_WORKERS",
+            coerce=int,
+        ),
+        "install.adaptive": ConfigItem(
+            "Adjust the number of running jobs of each stage by the throughput",
+            False,
+            env_var="PDM_INSTALL_ADAPTIVE",
+            coerce=ensure_boolean,
+        ),
+        "install.download_workers": ConfigItem(
+            "The number of workers to download packages, 0 to use max_workers",
+            0,
+            env_var="PDM_INSTALL_DOWNLOAD_WORKERS",
+            coerce=int,
+        ),
+        "install.build_workers": ConfigItem(
+            "The number of workers to build wheels, 0 to use half of max_workers",
+            0,
+            env_var="PDM_INSTALL_BUILD_WORKERS",
+            coerce=int,
+        ),
+        "install.install_workers": ConfigItem(
+            "The number of workers to install wheels, 0 to use max_workers",
+            0,
+            env_var="PDM_INSTALL_INSTALL_WORKERS",
+            coerce=int,
+        ),
         "python.path": ConfigItem("The Python interpreter path", env_var="PDM_PYTHON"),
         "python.use_pyenv": ConfigItem(
             "Use the pyenv interpreter", True, coerce=ensure_boolean
@@ -191,6 +266,24 @@ class Config(MutableMapping[str, str]):
             coerce=ensure_boolean,
             replace="use_venv",
         ),
+        "pypi.max_connections": ConfigItem(
+            "The maximum number of concurrent connections to each host",
+            10,
+            env_var="PDM_MAX_CONNECTIONS",
+            coerce=int,
+        ),
+        "pypi.index_ttl": ConfigItem(
+            "The number of seconds to use cached index pages without revalidating",
+            0,
+            env_var="PDM_INDEX_TTL",
+            coerce=int,
+        ),
+        "pypi.stale_while_revalidate": ConfigItem(
+            "Use stale index pages from the cache and revalidate them in background",
+            False,
+            env_var="PDM_STALE_WHILE_REVALIDATE",
+            coerce=ensure_boolean,
+        ),
         "pypi.url": ConfigItem(
             "The URL of PyPI mirror, defaults to https://pypi.org/simple",
             DEFAULT_PYPI_INDEX,
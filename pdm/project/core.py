@@ -17,7 +17,13 @@ from findpython import Finder
 from pdm import termui
 from pdm._types import Source
 from pdm.exceptions import NoPythonVersion, PdmUsageError, ProjectError
-from pdm.models.caches import CandidateInfoCache, HashCache, WheelCache
+from pdm.models.caches import (
+    CandidateInfoCache,
+    HashCache,
+    IndexPageCache,
+    LockfileCache,
+    WheelCache,
+)
 from pdm.models.candidates import Candidate
 from pdm.models.environment import Environment, GlobalEnvironment
 from pdm.models.python import PythonInfo
@@ -147,11 +153,17 @@ class Project:
 
     @property
     def lockfile(self) -> dict:
+        """The content of the lock file, as plain dicts parsed with the fast
+        ``tomllib`` and cached until the lock file is written. It is shared by all
+        readers and must not be modified in place.
+
+        The parsed content is also saved in the cache directory, so that the same
+        lock file doesn't need to be parsed again by later commands.
+        """
         if not self._lockfile:
             if not self.lockfile_file.is_file():
                 raise ProjectError("Lock file does not exist.")
-            data = tomlkit.parse(self.lockfile_file.read_text("utf-8"))
-            self._lockfile = cast(dict, data)
+            self._lockfile = self.make_lockfile_cache().load(self.lockfile_file)
         return self._lockfile
 
     @lockfile.setter
@@ -432,10 +444,8 @@ class Project:
 
     @property
     def locked_repository(self) -> LockedRepository:
-        import copy
-
         try:
-            lockfile = copy.deepcopy(self.lockfile)
+            lockfile = self.lockfile
         except ProjectError:
             lockfile = {}
 
@@ -514,10 +524,26 @@ class Project:
         content_hash.trivia.trail = "\n\n"
         return {"lock_version": self.LOCKFILE_VERSION, "content_hash": content_hash}
 
+    def _make_lockfile_document(self, data: dict) -> tomlkit.TOMLDocument:
+        """Make a TOML document of the plain dicts of :attr:`lockfile` without
+        modifying them. The format is taken from the lock file if the content is
+        unchanged.
+        """
+        if self.lockfile_file.is_file():
+            doc = tomlkit.parse(self.lockfile_file.read_text("utf-8"))
+            if doc == data:
+                return doc
+        doc = tomlkit.document()
+        for key, value in data.items():
+            doc.add(key, tomlkit.item(value))
+        return doc
+
     def write_lockfile(
         self, toml_data: dict, show_message: bool = True, write: bool = True
     ) -> None:
-        toml_data["metadata"].update(self.get_lock_metadata())
+        if not isinstance(toml_data, tomlkit.TOMLDocument):
+            toml_data = self._make_lockfile_document(toml_data)
+        cast(dict, toml_data["metadata"]).update(self.get_lock_metadata())
 
         if write:
             with atomic_open_for_write(self.lockfile_file) as fp:
@@ -651,15 +677,17 @@ dependencies = ["pip", "setuptools", "wheel"]
         return WheelCache(self.cache("wheels"))
 
     def make_candidate_info_cache(self) -> CandidateInfoCache:
-        python_hash = hashlib.sha1(
-            str(self.environment.python_requires).encode()
-        ).hexdigest()
-        file_name = f"package_meta_{python_hash}.json"
-        return CandidateInfoCache(self.cache("metadata") / file_name)
+        return CandidateInfoCache(self.cache("metadata") / "package_meta.db")
 
     def make_hash_cache(self) -> HashCache:
         return HashCache(directory=self.cache("hashes"))
 
+    def make_index_page_cache(self) -> IndexPageCache:
+        return IndexPageCache(self.cache("metadata") / "index_pages.db")
+
+    def make_lockfile_cache(self) -> LockfileCache:
+        return LockfileCache(self.cache("metadata") / "lockfiles")
+
     def find_interpreters(self, python_spec: str | None = None) -> Iterable[PythonInfo]:
         """Return an iterable of interpreter paths that matches the given specifier,
         which can be:
@@ -1 +1 @@
-from pdm.resolver.core import resolve  # noqa
+from pdm.resolver.core import resolve, resolve_from_lock_graph  # noqa
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Dict, cast
 
+from pdm.exceptions import CandidateInfoNotFound
 from pdm.models.candidates import Candidate
 from pdm.resolver.providers import BaseProvider
 from pdm.resolver.python import PythonRequirement
@@ -26,9 +27,14 @@ def resolve(
         2. A map of resolved dependencies for each dependency group
         3. A map of package descriptions fetched from PyPI source
     """
-    requirements.append(PythonRequirement.from_pyspec_set(requires_python))
     provider = cast(BaseProvider, resolver.provider)
-    result = resolver.resolve(requirements, max_rounds)
+    provider.repository.prefetch(requirements)
+    requirements.append(PythonRequirement.from_pyspec_set(requires_python))
+    try:
+        result = resolver.resolve(requirements, max_rounds)
+    finally:
+        provider.stop_speculation()
+        provider.repository.stop_prefetch()
 
     mapping = cast(Dict[str, Candidate], result.mapping)
     mapping.pop("python", None)
@@ -43,3 +49,40 @@ def resolve(
             key = new_key
 
     return mapping, provider.fetched_dependencies
+
+
+def resolve_from_lock_graph(
+    provider: BaseProvider, requirements: list[Requirement]
+) -> dict[str, Candidate] | None:
+    """Walk the locked dependency edges from the given requirements, without
+    running the resolver. The provider must be backed by a locked repository,
+    which only yields the candidates compatible with the running interpreter and
+    drops the dependencies whose markers don't match the environment.
+
+    Return the map of pinned candidates, or None if the lock can't pin the
+    requirements unambiguously, in which case the resolver should be used.
+    """
+    mapping: dict[str, Candidate] = {}
+    pending = list(requirements)
+    while pending:
+        req = pending.pop()
+        if isinstance(req, PythonRequirement):
+            continue
+        identifier = provider.identify(req)
+        if identifier in mapping:
+            if not provider.is_satisfied_by(req, mapping[identifier]):
+                return None
+            continue
+        matches = [
+            can
+            for can in provider.repository.find_candidates(req)
+            if provider.is_satisfied_by(req, can)
+        ]
+        if len(matches) != 1:
+            return None
+        mapping[identifier] = candidate = matches[0]
+        try:
+            pending.extend(provider.get_dependencies(candidate))
+        except (KeyError, CandidateInfoNotFound):
+            return None
+    return mapping
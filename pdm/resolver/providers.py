@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Callable, cast
 
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
@@ -23,6 +26,7 @@ if TYPE_CHECKING:
     from pdm._types import Comparable
     from pdm.models.repositories import BaseRepository
     from pdm.models.requirements import Requirement
+    from pdm.models.specifiers import PySpecSet
 
 
 class BaseProvider(AbstractProvider):
@@ -37,6 +41,14 @@ class BaseProvider(AbstractProvider):
         self.fetched_dependencies: dict[str, list[Requirement]] = {}
         self.overrides = overrides or {}
         self._known_depth: dict[str, int] = {}
+        self._speculations: dict[int, tuple[Candidate, Future]] = {}
+        self._speculation_lock = threading.Lock()
+        self._speculation_executor: ThreadPoolExecutor | None = None
+        #: The number of top matching candidates of each identifier whose
+        #: dependencies are prepared in the background before the resolver asks
+        self.speculative_candidates = repository.environment.project.config[
+            "strategy.speculative_candidates"
+        ]
 
     def requirement_preference(self, requirement: Requirement) -> Comparable:
         """Return the preference of a requirement to find candidates.
@@ -144,15 +156,70 @@ class BaseProvider(AbstractProvider):
                 return iter(self.get_override_candidates(identifier))
             reqs = sorted(requirements[identifier], key=self.requirement_preference)
             candidates = self._find_candidates(reqs[0])
-            return (
+            matches = (
                 can
                 for can in candidates
                 if can not in incompat
                 and all(self.is_satisfied_by(r, can) for r in reqs)
             )
+            top_matches = list(itertools.islice(matches, self.speculative_candidates))
+            self.speculate(top_matches)
+            return itertools.chain(top_matches, matches)
 
         return matches_gen
 
+    def speculate(self, candidates: Iterable[Candidate]) -> None:
+        """Start getting the dependencies of the candidates in the background,
+        the results are consumed when the resolver asks for them.
+
+        Only wheels whose metadata files are served by the index(PEP 658) are
+        speculated on, which can be prepared without downloading or building
+        the distributions.
+        """
+        for candidate in candidates:
+            link = candidate.link
+            if not (
+                candidate.req.is_named
+                and link is not None
+                and link.is_wheel
+                and getattr(link, "dist_info_metadata", None)
+            ):
+                continue
+            with self._speculation_lock:
+                if id(candidate) in self._speculations:
+                    continue
+                if self._speculation_executor is None:
+                    self._speculation_executor = ThreadPoolExecutor(
+                        self.repository.environment.project.config[
+                            "pypi.max_connections"
+                        ]
+                    )
+                future = self._speculation_executor.submit(
+                    self.repository.get_dependencies, candidate
+                )
+                self._speculations[id(candidate)] = (candidate, future)
+
+    def stop_speculation(self) -> None:
+        """Cancel the pending speculations and wait for the running ones, so that
+        their results are stored in the caches before they are committed.
+        """
+        with self._speculation_lock:
+            for _, future in self._speculations.values():
+                future.cancel()
+            self._speculations.clear()
+            executor, self._speculation_executor = self._speculation_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _get_repository_dependencies(
+        self, candidate: Candidate
+    ) -> tuple[list[Requirement], PySpecSet, str]:
+        with self._speculation_lock:
+            speculation = self._speculations.get(id(candidate))
+        if speculation is not None and not speculation[1].cancelled():
+            return speculation[1].result()
+        return self.repository.get_dependencies(candidate)
+
     def is_satisfied_by(self, requirement: Requirement, candidate: Candidate) -> bool:
         if isinstance(requirement, PythonRequirement):
             return is_python_satisfied_by(requirement, candidate)
@@ -177,7 +244,7 @@ class BaseProvider(AbstractProvider):
     def get_dependencies(self, candidate: Candidate) -> list[Requirement]:
         if isinstance(candidate, PythonCandidate):
             return []
-        deps, requires_python, _ = self.repository.get_dependencies(candidate)
+        deps, requires_python, _ = self._get_repository_dependencies(candidate)
 
         # Filter out incompatible dependencies(e.g. functools32) early so that
         # we don't get errors when building wheels.
@@ -193,6 +260,7 @@ class BaseProvider(AbstractProvider):
             dep.requires_python &= candidate.req.requires_python
             valid_deps.append(dep)
         self.fetched_dependencies[self.identify(candidate)] = valid_deps[:]
+        self.repository.prefetch(valid_deps)
         # A candidate contributes to the Python requirements only when:
         # It isn't an optional dependency, or the requires-python doesn't cover
         # the req's requires-python.
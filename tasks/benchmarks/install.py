@@ -0,0 +1,97 @@
+"""Benchmark the parallel installation with different numbers of workers.
+
+It generates a few hundred small wheels into a local directory, which is used as
+the only package source of a project, and installs all of them from scratch
+with each setting of workers.
+"""
+import base64
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+from utils import Executor, echo
+
+PDM = os.getenv("PDM", "pdm")
+PACKAGES = int(os.getenv("BENCHMARK_PACKAGES", "300"))
+SETTINGS = [
+    ("1 worker", {"install.max_workers": "1"}),
+    ("4 workers", {"install.max_workers": "4"}),
+    ("16 workers", {"install.max_workers": "16"}),
+    (
+        "adaptive, up to 16 workers",
+        {"install.max_workers": "16", "install.adaptive": "true"},
+    ),
+]
+
+
+def _record_line(name: str, content: bytes) -> str:
+    digest = base64.urlsafe_b64encode(hashlib.sha256(content).digest()).rstrip(b"=")
+    return f"{name},sha256={digest.decode()},{len(content)}"
+
+
+def make_wheel(directory: Path, name: str, version: str = "1.0.0") -> None:
+    dist_info = f"{name}-{version}.dist-info"
+    files = {
+        f"{name}/__init__.py": b"".join(
+            f"def func_{i}():\n    return {i}\n\n".encode() for i in range(50)
+        ),
+        f"{name}/data.txt": os.urandom(8 * 1024).hex().encode(),
+        f"{dist_info}/METADATA": (
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        ).encode(),
+        f"{dist_info}/WHEEL": (
+            b"Wheel-Version: 1.0\nGenerator: benchmark\nRoot-Is-Purelib: true\n"
+            b"Tag: py3-none-any\n"
+        ),
+    }
+    record = [_record_line(path, content) for path, content in files.items()]
+    record.append(f"{dist_info}/RECORD,,")
+    files[f"{dist_info}/RECORD"] = "\n".join(record).encode()
+    wheel = directory / f"{name}-{version}-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path, content in files.items():
+            zf.writestr(path, content)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory(prefix="pdm-benchmark-") as tempdir:
+        root = Path(tempdir)
+        wheels = root / "wheels"
+        wheels.mkdir()
+        names = [f"bench_pkg_{i:04d}" for i in range(PACKAGES)]
+        for name in names:
+            make_wheel(wheels, name)
+        project_file = root / "project" / "pyproject.toml"
+        project_file.parent.mkdir()
+        dependencies = "\n".join(f'    "{name.replace("_", "-")}",' for name in names)
+        python_version = "{}.{}".format(*sys.version_info[:2])
+        project_file.write_text(
+            f'[project]\nrequires-python = ">={python_version}"\n'
+            f"dependencies = [\n{dependencies}\n]\n\n"
+            "[[tool.pdm.source]]\n"
+            'name = "pypi"\n'
+            f'url = "{wheels.as_uri()}"\n'
+            'type = "find_links"\n'
+        )
+        executor = Executor(PDM, project_file)
+        executor.run(["config", "cache_dir", str(root / "cache")])
+        executor.run(["config", "--local", "python.use_venv", "false"])
+        executor.run(["lock"])
+        echo(f"Running install benchmark with {PACKAGES} wheels", style="green")
+        packages_dir = project_file.with_name("__pypackages__")
+        for text, settings in SETTINGS:
+            for key, value in settings.items():
+                executor.run(["config", "--local", key, value])
+            shutil.rmtree(packages_dir, ignore_errors=True)
+            executor.measure(f"Install with {text}", ["sync"])
+            for key in settings:
+                executor.run(["config", "--local", "--delete", key])
+        executor.run(["config", "--delete", "cache_dir"])
+
+
+if __name__ == "__main__":
+    main()
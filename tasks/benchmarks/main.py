@@ -1,7 +1,7 @@
 import os
 import shutil
 
-from utils import Executor, benchmark, project
+from utils import Executor, benchmark, directory_size, echo, project
 
 
 @project(os.getenv("PIPENV", "pipenv"), "Pipfile")
@@ -43,6 +43,14 @@ def run_pdm(executor: Executor):
     executor.measure("Add dependencies with cache", ["add", "click"])
     shutil.rmtree(cache_dir)
     executor.measure("Add dependencies without cache", ["add", "pytz"])
+    executor.measure("Lock dependencies with warm cache", ["lock"])
+    echo(f"{'HTTP cache size:':>42s} {directory_size(cache_dir / 'http')}")
+    executor.run(["config", "cache.http.compress", "true"])
+    shutil.rmtree(cache_dir)
+    executor.run(["lock"])
+    executor.measure("Lock dependencies with compressed warm cache", ["lock"])
+    echo(f"{'Compressed HTTP cache size:':>42s} {directory_size(cache_dir / 'http')}")
+    executor.run(["config", "--delete", "cache.http.compress"])
     executor.run(["config", "--delete", "cache_dir"])
 
 
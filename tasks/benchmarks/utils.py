@@ -24,6 +24,11 @@ def echo(*args: str, err: bool = False, **kwargs: Any):
 PROJECT_DIR = Path(__file__).parent.joinpath("projects")
 
 
+def directory_size(directory: Path) -> str:
+    size = sum(f.stat().st_size for f in directory.rglob("*") if f.is_file())
+    return f"{size / 1000.0 / 1000:.1f} MB"
+
+
 class Executor:
     def __init__(self, cmd: str, project_file: Path) -> None:
         self.cmd = cmd
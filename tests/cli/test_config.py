@@ -205,3 +205,10 @@ def test_config_del_repository(project):
 
     del project.global_config["repository.test"]
     assert project.global_config.get_repository_config("test") is None
+
+
+def test_offline_option_sets_config(project, invoke, monkeypatch):
+    monkeypatch.setenv("PDM_OFFLINE", "0")
+    assert not project.config["offline"]
+    result = invoke(["--offline", "config", "offline"], obj=project)
+    assert result.output.strip() == "True"
@@ -1,6 +1,13 @@
+import json
+import os
+from pathlib import Path
+
 import pytest
 
+from pdm import signals
 from pdm.cli import actions
+from pdm.cli.hooks import HookManager
+from pdm.installers import Synchronizer
 from pdm.models.requirements import parse_requirement
 from tests.conftest import Distribution
 
@@ -65,6 +72,112 @@ def test_sync_dry_run(project, working_set):
     assert working_set["chardet"].version == "3.0.1"
 
 
+@pytest.mark.usefixtures("repository")
+def test_sync_skipped_if_nothing_changed(project, working_set, mocker):
+    project.add_dependencies({"requests": parse_requirement("requests")})
+    actions.do_lock(project)
+    actions.do_sync(project)
+    assert "requests" in working_set
+
+    synchronize = mocker.spy(Synchronizer, "synchronize")
+    actions.do_sync(project)
+    synchronize.assert_not_called()
+    # Different options need another sync
+    actions.do_sync(project, clean=True)
+    synchronize.assert_called_once()
+
+    # Changes of the site-packages directory need another sync
+    purelib = Path(project.environment.get_paths()["purelib"])
+    purelib.mkdir(parents=True, exist_ok=True)
+    os.utime(purelib, ns=(1, 1))
+    actions.do_sync(project, clean=True)
+    assert synchronize.call_count == 2
+
+    # Changes of the install settings need another sync
+    project.project_config["install.cache"] = True
+    actions.do_sync(project, clean=True)
+    assert synchronize.call_count == 3
+
+
+@pytest.mark.usefixtures("repository")
+def test_skipped_sync_emits_install_hooks(project, working_set, mocker):
+    project.add_dependencies({"requests": parse_requirement("requests")})
+    actions.do_lock(project)
+    actions.do_sync(project)
+
+    pre_install, post_install = mocker.Mock(), mocker.Mock()
+    synchronize = mocker.spy(Synchronizer, "synchronize")
+    with signals.pre_install.connected_to(
+        pre_install
+    ), signals.post_install.connected_to(post_install):
+        actions.do_sync(project)
+    synchronize.assert_not_called()
+    for hook in (pre_install, post_install):
+        hook.assert_called_once()
+        assert "requests" in hook.call_args[1]["candidates"]
+
+    # The lock file isn't resolved if the hooks are skipped
+    resolve = mocker.spy(actions, "resolve_candidates_from_lockfile")
+    actions.do_sync(project, hooks=HookManager(project, [":all"]))
+    resolve.assert_not_called()
+
+
+def test_sync_fingerprints_are_pruned(project, tmp_path, monkeypatch):
+    monkeypatch.setattr(actions, "MAX_SYNC_FINGERPRINTS", 3)
+    fingerprints = actions.JSONFileCache(tmp_path / "sync_fingerprints.json")
+    fingerprints.set(str(tmp_path / "removed"), "0")
+    roots = []
+    for i in range(4):
+        root = tmp_path / f"project{i}"
+        root.mkdir()
+        roots.append(str(root))
+        actions.save_sync_fingerprint(fingerprints, str(root), str(i))
+    actions.save_sync_fingerprint(fingerprints, roots[1], "5")
+
+    assert list(fingerprints) == [roots[2], roots[3], roots[1]]
+    reloaded = actions.JSONFileCache(tmp_path / "sync_fingerprints.json")
+    assert [reloaded.get(key) for key in reloaded] == ["2", "3", "5"]
+
+
+@pytest.mark.usefixtures("repository")
+def test_sync_in_download_build_install_stages(project, working_set):
+    project.add_dependencies({"requests": parse_requirement("requests")})
+    actions.do_lock(project)
+    actions.do_sync(project)
+    manager = Synchronizer.get_manager()
+    for key in ("requests", "idna", "chardet"):
+        assert key in working_set
+        stages = [name for name, args, _ in manager.method_calls if args[0].name == key]
+        assert stages == ["download", "build", "install"]
+
+
+@pytest.mark.usefixtures("repository")
+def test_sync_with_adaptive_workers(project, working_set):
+    project.project_config["install.max_workers"] = 2
+    project.project_config["install.adaptive"] = True
+    actions.do_add(project, packages=["requests"])
+    for key in ("requests", "idna", "chardet", "urllib3"):
+        assert key in working_set
+
+
+@pytest.mark.usefixtures("repository")
+def test_sync_longest_jobs_first(project, working_set):
+    project.project_config["install.download_workers"] = 1
+    project.add_dependencies({"requests": parse_requirement("requests")})
+    actions.do_lock(project)
+    timings_file = project.cache("metadata") / "install_timings.json"
+    timings_file.write_text(json.dumps({"idna": 10.0, "chardet": 5.0}))
+    actions.do_sync(project)
+    downloads = [
+        args[0].name
+        for name, args, _ in Synchronizer.get_manager().method_calls
+        if name == "download"
+    ]
+    assert downloads[:2] == ["idna", "chardet"]
+    timings = json.loads(timings_file.read_text())
+    assert set(downloads) <= set(timings)
+
+
 @pytest.mark.usefixtures("repository")
 def test_sync_only_different(project, working_set, capsys):
     working_set.add_distribution(Distribution("foo", "0.1.0"))
@@ -4,9 +4,12 @@ import collections
 import functools
 import json
 import os
+import re
 import shutil
 import sys
+import threading
 from dataclasses import dataclass
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO, StringIO
 from pathlib import Path
 from typing import Callable, Iterable, Mapping
@@ -72,8 +75,14 @@ class LocalFileAdapter(requests.adapters.BaseAdapter):
         if request_path in self.overrides:
             response.status_code = 200
             response.reason = "OK"
-            response.raw = BytesIO(self.overrides[request_path])
-            response.headers["Content-Type"] = "text/html"
+            content = self.overrides[request_path]
+            content_type = "text/html"
+            if isinstance(content, dict):
+                # A response of the JSON simple API
+                content = json.dumps(content).encode()
+                content_type = "application/vnd.pypi.simple.v1+json"
+            response.raw = BytesIO(content)
+            response.headers["Content-Type"] = content_type
         elif file_path is None or not file_path.exists():
             response.status_code = 404
             response.reason = "Not Found"
@@ -109,6 +118,8 @@ class MockGit(Git):
 
 class _FakeLink:
     is_wheel = False
+    comes_from = "https://my.pypi.org/simple/"
+    dist_info_metadata = None
 
 
 class TestRepository(BaseRepository):
@@ -238,6 +249,52 @@ def working_set(mocker, repository):
     yield rv
 
 
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Serve the files with the support of range requests and cache headers"""
+
+    support_range = True
+
+    def log_message(self, *args):
+        pass
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "max-age=600")
+        super().end_headers()
+
+    def do_GET(self):
+        match = re.match(r"bytes=(\d*)-(\d*)", self.headers.get("Range", ""))
+        if not self.support_range or match is None:
+            return super().do_GET()
+        content = open(self.translate_path(self.path), "rb").read()
+        if not match.group(1):
+            start, end = max(len(content) - int(match.group(2)), 0), len(content) - 1
+        else:
+            start = int(match.group(1))
+            end = min(int(match.group(2) or len(content) - 1), len(content) - 1)
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self.wfile.write(content[start : end + 1])
+
+
+@pytest.fixture()
+def range_request_handler():
+    """The handler class of ``fixtures_server``, to patch or spy on in tests"""
+    return RangeRequestHandler
+
+
+@pytest.fixture()
+def fixtures_server(range_request_handler):
+    handler = functools.partial(range_request_handler, directory=str(FIXTURES))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
 def get_pypi_session(*args, overrides=None, **kwargs):
     session = PDMSession(*args, **kwargs)
     session.mount("http://fixtures.test/", LocalFileAdapter({"/": FIXTURES}))
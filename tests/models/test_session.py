@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from pdm.exceptions import OfflineError
+from pdm.models.session import PDMCacheAdapter, PDMSession
+
+
+def test_offline_session_reads_from_cache(tmp_path, fixtures_server):
+    url = f"{fixtures_server}/artifacts/demo-0.0.1.tar.gz"
+    with PDMSession(cache_dir=tmp_path) as session:
+        content = session.get(url).content
+
+    with PDMSession(cache_dir=tmp_path, offline=True) as session:
+        resp = session.get(url)
+        assert resp.from_cache
+        assert resp.content == content
+
+        with pytest.raises(OfflineError, match="not found in the cache"):
+            session.get(f"{fixtures_server}/artifacts/demo-0.0.1-py2.py3-none-any.whl")
+
+
+def test_session_limits_connections_per_host(tmp_path):
+    with PDMSession(cache_dir=tmp_path, max_connections=2) as session:
+        adapter = session.get_adapter("https://pypi.org/simple/")
+        pool = adapter.poolmanager.connection_from_url("https://pypi.org/simple/")
+        assert pool.block
+        assert pool.pool.maxsize == 2
+
+
+def test_finders_share_session_of_same_sources(project):
+    environment = project.environment
+    with environment.get_finder() as finder, environment.get_finder() as other:
+        assert finder.session is other.session
+    sources = [{"url": "https://test.pypi.org/simple", "name": "test"}]
+    with environment.get_finder(sources) as other:
+        assert finder.session is not other.session
+
+
+def test_index_pages_within_ttl_are_not_revalidated(
+    tmp_path, fixtures_server, range_request_handler, mocker
+):
+    do_get = mocker.spy(range_request_handler, "do_GET")
+    url = f"{fixtures_server}/artifacts/demo-0.0.1.tar.gz"
+    headers = {"Accept": "text/html", "Cache-Control": "max-age=0"}
+    with PDMSession(cache_dir=tmp_path, index_ttl=600) as session:
+        assert not session.get(url, headers=headers).from_cache
+        assert session.get(url, headers=headers).from_cache
+    assert do_get.call_count == 1
+
+    with PDMSession(cache_dir=tmp_path) as session:
+        session.get(url, headers=headers)
+    assert do_get.call_count == 2
+
+
+def test_stale_index_pages_revalidated_in_background(
+    tmp_path, fixtures_server, range_request_handler, mocker
+):
+    do_get = mocker.spy(range_request_handler, "do_GET")
+    url = f"{fixtures_server}/artifacts/demo-0.0.1.tar.gz"
+    headers = {"Accept": "text/html", "Cache-Control": "max-age=0"}
+    with PDMSession(cache_dir=tmp_path, stale_while_revalidate=True) as session:
+        content = session.get(url, headers=headers).content
+        resp = session.get(url, headers=headers)
+        assert resp.from_cache
+        assert resp.content == content
+        for _ in range(50):
+            if do_get.call_count == 2:
+                break
+            time.sleep(0.1)
+    assert do_get.call_count == 2
+
+
+def test_stale_index_pages_revalidated_in_bounded_threads(
+    tmp_path, fixtures_server, mocker
+):
+    threads, started, finished = set(), [], []
+    revalidate = PDMCacheAdapter._revalidate
+
+    def wrapped_revalidate(self, request, **kwargs):
+        threads.add(threading.current_thread().name)
+        started.append(request.url)
+        revalidate(self, request, **kwargs)
+        finished.append(request.url)
+
+    mocker.patch.object(PDMCacheAdapter, "_revalidate", wrapped_revalidate)
+    url = f"{fixtures_server}/artifacts/demo-0.0.1.tar.gz"
+    urls = [f"{url}?page={i}" for i in range(20)]
+    headers = {"Accept": "text/html", "Cache-Control": "max-age=0"}
+    with PDMSession(cache_dir=tmp_path, stale_while_revalidate=True) as session:
+        for url in urls:
+            session.get(url, headers=headers)
+        for url in urls:
+            assert session.get(url, headers=headers).from_cache
+    # Closing the session cancels the pending revalidations and waits for the
+    # running ones.
+    assert started
+    assert sorted(finished) == sorted(started)
+    assert len(threads) <= PDMSession.REVALIDATE_WORKERS
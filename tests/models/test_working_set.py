@@ -0,0 +1,58 @@
+import os
+import shutil
+
+from pdm.models import working_set
+from pdm.models.working_set import WorkingSet
+
+
+def make_dist_info(parent, dirname, name, version):
+    dist_info = parent / f"{dirname}-{version}.dist-info"
+    dist_info.mkdir()
+    dist_info.joinpath("METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n\nLong text\n"
+    )
+
+
+def test_working_set_index_by_dist_info_names(tmp_path):
+    make_dist_info(tmp_path, "Foo_Bar", "Foo-Bar", "1.0")
+    make_dist_info(tmp_path, "zope_interface", "zope.interface", "5.0")
+    make_dist_info(tmp_path, "requests", "requests", "2.28.0")
+    tmp_path.joinpath("requests").mkdir()
+
+    working_set = WorkingSet([str(tmp_path)])
+    assert sorted(working_set) == ["foo-bar", "requests", "zope.interface"]
+    assert working_set["requests"].version == "2.28.0"
+    assert working_set["zope.interface"].metadata["Name"] == "zope.interface"
+
+    make_dist_info(tmp_path, "idna", "idna", "3.4")
+    assert "idna" in WorkingSet([str(tmp_path)])
+
+
+def test_working_set_detects_replaced_dist_with_same_mtime(tmp_path):
+    make_dist_info(tmp_path, "foo", "foo", "1.0")
+    mtime = tmp_path.stat().st_mtime_ns
+    assert WorkingSet([str(tmp_path)])["foo"].version == "1.0"
+
+    shutil.rmtree(tmp_path / "foo-1.0.dist-info")
+    make_dist_info(tmp_path, "foo", "foo", "2.0")
+    os.utime(tmp_path, ns=(mtime, mtime))
+    assert WorkingSet([str(tmp_path)])["foo"].version == "2.0"
+
+
+def test_working_set_snapshot_is_reused_by_later_processes(tmp_path, mocker):
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    make_dist_info(lib, "Foo_Bar", "Foo-Bar", "1.0")
+    snapshot_file = tmp_path / "working_set.json"
+    assert "foo-bar" in WorkingSet([str(lib)], snapshot_file=snapshot_file)
+
+    # A new process starts with no snapshots in memory
+    mocker.patch.dict(working_set._directory_snapshots, clear=True)
+    read_name = mocker.spy(working_set, "_read_name_header")
+    assert "foo-bar" in WorkingSet([str(lib)], snapshot_file=snapshot_file)
+    read_name.assert_not_called()
+
+    make_dist_info(lib, "zope_interface", "zope.interface", "5.0")
+    mocker.patch.dict(working_set._directory_snapshots, clear=True)
+    assert "zope.interface" in WorkingSet([str(lib)], snapshot_file=snapshot_file)
+    assert read_name.called
@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest
 from resolvelib.resolvers import ResolutionImpossible, Resolver
 
@@ -51,6 +54,60 @@ def test_resolve_named_requirement(resolve):
     assert result["idna"].version == "2.7"
 
 
+@pytest.mark.parametrize(
+    "dist_info_metadata,speculative_candidates,speculated",
+    [("true", 2, True), (None, 2, False), ("true", 0, False)],
+)
+def test_resolve_speculate_dependencies_in_background(
+    project,
+    resolve,
+    repository,
+    mocker,
+    dist_info_metadata,
+    speculative_candidates,
+    speculated,
+):
+    mocker.patch("tests.conftest._FakeLink.is_wheel", True)
+    mocker.patch("tests.conftest._FakeLink.dist_info_metadata", dist_info_metadata)
+    project.project_config["strategy.speculative_candidates"] = speculative_candidates
+    threads = set()
+    get_dependencies = repository.get_dependencies
+
+    def wrapped_get_dependencies(candidate):
+        threads.add(threading.current_thread())
+        return get_dependencies(candidate)
+
+    mocker.patch.object(
+        repository, "get_dependencies", side_effect=wrapped_get_dependencies
+    )
+    result = resolve(["requests"])
+
+    assert result["requests"].version == "2.19.1"
+    assert result["urllib3"].version == "1.22"
+    background_threads = threads - {threading.main_thread()}
+    assert bool(background_threads) is speculated
+
+
+def test_stop_speculation_waits_for_running_ones(project, repository, mocker):
+    mocker.patch("tests.conftest._FakeLink.is_wheel", True)
+    mocker.patch("tests.conftest._FakeLink.dist_info_metadata", "true")
+    provider = project.get_provider()
+    started, finished = threading.Event(), []
+
+    def get_dependencies(candidate):
+        started.set()
+        time.sleep(0.2)
+        finished.append(candidate)
+        return [], PySpecSet(), ""
+
+    mocker.patch.object(repository, "get_dependencies", side_effect=get_dependencies)
+    candidate = next(iter(repository.find_candidates(parse_requirement("requests"))))
+    provider.speculate([candidate])
+    started.wait(5)
+    provider.stop_speculation()
+    assert finished == [candidate]
+
+
 def test_resolve_requires_python(resolve):
     result = resolve(["django"])
     assert result["django"].version == "1.11.8"
@@ -322,3 +379,32 @@ def test_resolve_extra_and_underlying_to_the_same_version(resolve, repository):
     repository.add_dependencies("bar", "0.1.0", ["foo[enc]>=0.1.0"])
     result = resolve(["foo==0.1.0", "bar"])
     assert result["foo"].version == result["foo[enc]"].version == "0.1.0"
+
+
+def test_resolve_candidates_from_lock_graph_without_resolver(project, mocker):
+    project.lockfile = {
+        "package": [
+            {"name": "pytest", "version": "4.6.0", "dependencies": ["py>=3.0"]},
+            {"name": "py", "version": "3.6.0"},
+        ]
+    }
+    resolver_class = mocker.patch.object(project.core, "resolver_class")
+    result = resolve_candidates_from_lockfile(project, [parse_requirement("pytest")])
+    resolver_class.assert_not_called()
+    assert result["pytest"].version == "4.6.0"
+    assert result["py"].version == "3.6.0"
+
+
+def test_resolve_candidates_from_stale_lock_graph(project, mocker):
+    project.lockfile = {
+        "package": [
+            {"name": "pytest", "version": "4.6.0", "dependencies": ["py>=4.0"]},
+            {"name": "py", "version": "3.6.0"},
+        ]
+    }
+    resolver_spy = mocker.patch.object(
+        project.core, "resolver_class", wraps=project.core.resolver_class
+    )
+    with pytest.raises(ResolutionImpossible):
+        resolve_candidates_from_lockfile(project, [parse_requirement("pytest")])
+    resolver_spy.assert_called_once()
@@ -1,10 +1,16 @@
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from cachecontrol.controller import CacheController
 from unearth import Link
 
-from pdm.installers import InstallManager
+from pdm.installers import InstallManager, Synchronizer
+from pdm.installers.synchronizers import AdaptiveLimiter
+from pdm.models.caches import JSONFileCache, SafeFileCache
 from pdm.models.candidates import Candidate
 from pdm.models.requirements import parse_requirement
 from pdm.utils import fs_supports_symlink
@@ -176,6 +182,27 @@ def test_install_wheel_with_data_scripts(project, use_install_cache):
     assert not os.path.exists(bin_path)
 
 
+def test_compile_installed_files(project):
+    req = parse_requirement("demo")
+    candidate = Candidate(
+        req,
+        link=Link("http://fixtures.test/artifacts/demo-0.0.1-py2.py3-none-any.whl"),
+    )
+    installer = InstallManager(project.environment)
+    lib_path = project.environment.get_paths()["purelib"]
+    installer.install(candidate)
+    installer.compile()
+    dist = project.environment.get_working_set()["demo"]
+    cache_files = [str(path) for path in dist.files if str(path).endswith(".pyc")]
+    assert cache_files
+    assert all(os.path.exists(os.path.join(lib_path, f)) for f in cache_files)
+
+    remove_paths = installer.get_paths_to_remove(dist)
+    remove_paths.remove()
+    remove_paths.commit()
+    assert not any(os.path.exists(os.path.join(lib_path, f)) for f in cache_files)
+
+
 def test_compress_file_list_for_rename():
     from pdm.installers.uninstallers import compress_for_rename
 
@@ -193,3 +220,57 @@ def test_compress_file_list_for_rename():
     assert sorted(compress_for_rename(abs_paths)) == [
         os.path.join(project_root, "test-removal" + os.sep)
     ]
+
+
+def test_adaptive_limiter_grows_with_throughput():
+    limiter = AdaptiveLimiter(4, initial_limit=1)
+    lock = threading.Lock()
+    running = 0
+    max_running = max_limit = 0
+
+    def job():
+        nonlocal running, max_running, max_limit
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+            max_limit = max(max_limit, limiter.limit)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(40):
+            executor.submit(limiter.run, job)
+    assert max_limit > 1
+    assert max_running <= max_limit <= 4
+
+
+@pytest.mark.parametrize("build_workers,expected", [(0, 3), (5, 5)])
+def test_stage_executor_workers(project, build_workers, expected):
+    project.project_config["install.max_workers"] = 6
+    project.project_config["install.build_workers"] = build_workers
+    executors = Synchronizer({}, project.environment).create_stage_executors()
+    for executor in executors.values():
+        executor.shutdown()
+    assert executors["download"].max_workers == 6
+    assert executors["build"].max_workers == expected
+    assert executors["install"].max_workers == 6
+
+
+def test_estimate_cost_by_cached_artifacts(project, tmp_path):
+    cached = Link("https://my.pypi.org/packages/demo-0.0.1-py3-none-any.whl")
+    demo = Candidate(parse_requirement("demo"), name="demo", version="0.0.1")
+    demo.hashes = {cached: "sha256:1234"}
+    foo = Candidate(parse_requirement("foo"), name="foo", version="0.1.0")
+    foo.hashes = {Link("https://my.pypi.org/packages/foo-0.1.0.tar.gz"): "md5:5678"}
+    http_cache = SafeFileCache(str(project.cache("http")))
+    http_cache.set(CacheController.cache_url(cached.normalized), b"0" * 4096)
+
+    synchronizer = Synchronizer({"demo": demo, "foo": foo}, project.environment)
+    timings = JSONFileCache(tmp_path / "install_timings.json")
+    assert synchronizer.estimate_cost("demo", timings) == pytest.approx(
+        4096 / Synchronizer.INSTALL_BYTES_PER_SECOND
+    )
+    assert synchronizer.estimate_cost("foo", timings) == 0
+    timings.set("foo", 10.0)
+    assert synchronizer.estimate_cost("foo", timings) == 10.0
@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 import venv
 from pathlib import Path
@@ -8,6 +9,7 @@ from packaging.version import parse
 
 from pdm.cli.commands.venv.utils import get_venv_python
 from pdm.utils import cd
+from tests import FIXTURES
 
 
 def test_project_python_with_pyenv_support(project, mocker, monkeypatch):
@@ -265,3 +267,57 @@ def test_iter_project_venvs(project):
     dot_venv_python.touch()
     venv_keys = [key for key, _ in utils.iter_venvs(project)]
     assert sorted(venv_keys) == ["bar", "baz", "foo", "in-project"]
+
+
+def test_read_lockfile_as_plain_dict(project):
+    project.lockfile_file.write_text(
+        '[[package]]\nname = "foo"\nversion = "1.0.0"\nsummary = "Foo"\n\n'
+        '[metadata]\nlock_version = "4.0"\n'
+    )
+    lockfile = project.lockfile
+    assert type(lockfile["package"][0]) is dict
+    assert project.locked_repository.all_candidates["foo"].version == "1.0.0"
+    # Reading the lockfile into a repository doesn't modify the shared data
+    assert lockfile["package"][0] == {
+        "name": "foo",
+        "version": "1.0.0",
+        "summary": "Foo",
+    }
+    assert project.lockfile is lockfile
+
+
+def test_write_plain_lockfile_keeps_format(project):
+    content = (FIXTURES / "projects/demo-package/pdm.lock").read_text()
+    content = re.sub(
+        r'content_hash = ".*"',
+        f'content_hash = "sha256:{project.get_content_hash("sha256")}"',
+        content,
+    )
+    project.lockfile_file.write_text(content)
+    lockfile = project.lockfile
+    metadata = dict(lockfile["metadata"])
+
+    project.write_lockfile(lockfile, False)
+    assert project.lockfile_file.read_text() == content
+    assert lockfile["metadata"] == metadata
+
+
+def test_load_lockfile_from_cache(project, mocker):
+    project.lockfile_file.write_text(
+        '[[package]]\nname = "foo"\nversion = "1.0.0"\n\n'
+        '[metadata]\nlock_version = "4.0"\n'
+    )
+    assert project.lockfile["package"][0]["version"] == "1.0.0"
+
+    project._lockfile = None
+    loads = mocker.patch("pdm.models.caches.tomllib.loads")
+    assert project.lockfile["package"][0]["version"] == "1.0.0"
+    loads.assert_not_called()
+
+    # A changed lockfile is parsed again
+    project.lockfile_file.write_text(
+        project.lockfile_file.read_text().replace("1.0.0", "2.0.0")
+    )
+    project._lockfile = None
+    mocker.stopall()
+    assert project.lockfile["package"][0]["version"] == "2.0.0"